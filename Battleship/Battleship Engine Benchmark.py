@@ -0,0 +1,46 @@
+import time
+import tracemalloc
+import numpy as np
+from battleship_engine import boards_probabilities, consistent_fleets, fleet_cell_counts
+
+# Peak memory of the two exact engines as the fleet grows: consistent_fleets
+# stores one bitboard per fleet, fleet_cell_counts only counts them. Fleets
+# with more than MATERIALIZE_CAP configurations are counted only. Times are
+# taken on a separate run, since tracemalloc slows the Python search.
+
+# --- Config ---
+GRID_SIZE = 6
+FLEETS = [[3, 2], [3, 3, 2], [4, 3, 3, 2], [4, 3, 2, 2], [5, 4, 3, 3, 2]]
+MATERIALIZE_CAP = 20_000_000
+
+def measure(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+# --- Benchmark one fleet ---
+def benchmark(ship_sizes):
+    (fleets, counts), count_s, count_mb = measure(lambda: fleet_cell_counts(ship_sizes, GRID_SIZE))
+    r = {"fleet": ship_sizes, "fleets": fleets, "count_s": count_s, "count_mb": count_mb,
+         "stored_s": None, "stored_mb": None}
+    if fleets <= MATERIALIZE_CAP:
+        boards, r["stored_s"], r["stored_mb"] = measure(lambda: consistent_fleets(ship_sizes, GRID_SIZE))
+        if len(boards) != fleets or not np.allclose(boards_probabilities(boards, GRID_SIZE).ravel(),
+                                                    counts / fleets):
+            raise AssertionError(f"engines disagree for fleet {ship_sizes}")
+    return r
+
+if __name__ == "__main__":
+    print(f"{GRID_SIZE}x{GRID_SIZE} grid")
+    print(f"{'fleet':>16} {'fleets':>12} {'stored s':>9} {'stored MB':>10} {'count s':>8} {'count MB':>9}")
+    for ship_sizes in FLEETS:
+        r = benchmark(ship_sizes)
+        stored_s = f"{r['stored_s']:>9.2f}" if r["stored_s"] is not None else f"{'-':>9}"
+        stored_mb = f"{r['stored_mb']:>10.1f}" if r["stored_mb"] is not None else f"{'-':>10}"
+        print(f"{str(r['fleet']):>16} {r['fleets']:>12,} {stored_s} {stored_mb} "
+              f"{r['count_s']:>8.2f} {r['count_mb']:>9.3f}")
@@ -1,9 +1,8 @@
 import random
-import math
-import itertools
 import matplotlib.pyplot as plt
 import numpy as np
 import time
+from battleship_engine import FleetBelief
 
 # --- Config ---
 GRID_SIZE = 6
@@ -11,6 +10,10 @@ SHIP_SIZES = [3, 2]
 NUM_GAMES = 500
 MAX_MOVES = 50  # Safety cap, but most games will end sooner
 
+# Time spent updating the belief, per move number
+move_seconds = np.zeros(MAX_MOVES)
+move_counts = np.zeros(MAX_MOVES)
+
 # --- Board Representation ---
 def empty_board():
     return [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
@@ -42,65 +45,14 @@ def place_ships_randomly():
     return board, ships
 
 # --- Entropy Calculation ---
-def all_possible_ship_placements(hits, misses):
-    positions = []
-    for size in SHIP_SIZES:
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE - size + 1):
-                pos = [(r, c + i) for i in range(size)]
-                if all((r, c + i) not in misses for i in range(size)):
-                    positions.append(pos)
-        for r in range(GRID_SIZE - size + 1):
-            for c in range(GRID_SIZE):
-                pos = [(r + i, c) for i in range(size)]
-                if all((r + i, c) not in misses for i in range(size)):
-                    positions.append(pos)
-    all_combos = []
-    for combo in itertools.combinations(positions, len(SHIP_SIZES)):
-        cells = set()
-        valid = True
-        for ship in combo:
-            for cell in ship:
-                if cell in cells:
-                    valid = False
-                    break
-                cells.add(cell)
-            if not valid:
-                break
-        if not valid:
-            continue
-        if all(any(hit in ship for ship in combo) for hit in hits):
-            all_combos.append(combo)
-    return all_combos
-
-def board_entropy(hits, misses):
-    combos = all_possible_ship_placements(hits, misses)
-    if not combos:
-        return 0.0
-    total = len(combos)
-    cell_probs = [[0.0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-    for combo in combos:
-        occupied = set(cell for ship in combo for cell in ship)
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                if (r, c) in occupied:
-                    cell_probs[r][c] += 1
-    for r in range(GRID_SIZE):
-        for c in range(GRID_SIZE):
-            cell_probs[r][c] /= total
-    entropy = 0.0
-    for r in range(GRID_SIZE):
-        for c in range(GRID_SIZE):
-            p = cell_probs[r][c]
-            if 0 < p < 1:
-                entropy -= p * math.log2(p) + (1 - p) * math.log2(1 - p)
-    return entropy
+# Every game starts from the same no-shot belief; each shot narrows a copy
+PRIOR = FleetBelief.from_fleet(SHIP_SIZES, GRID_SIZE)
 
 # --- Simulation ---
 def simulate_entropy_trace():
     board, ships = place_ships_randomly()
+    belief = PRIOR.copy()
     hits = set()
-    misses = set()
     all_moves = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE)]
     random.shuffle(all_moves)
     entropies = []
@@ -109,9 +61,11 @@ def simulate_entropy_trace():
         r, c = move
         if board[r][c] == 1:
             hits.add((r, c))
-        else:
-            misses.add((r, c))
-        ent = board_entropy(hits, misses)
+        t0 = time.perf_counter()
+        belief.observe(r, c, board[r][c] == 1)
+        ent = belief.entropy()
+        move_seconds[move_num] += time.perf_counter() - t0
+        move_counts[move_num] += 1
         entropies.append(ent)
         # If all ship cells have been hit, entropy is zero, game is solved
         if ship_cells.issubset(hits):
@@ -154,6 +108,10 @@ plt.plot(avg_entropy, color='blue', linewidth=2.5, label="Average Entropy")
 
 end_time = time.time()
 print(f"Total runtime: {end_time - start_time:.2f} seconds")
+played = move_counts > 0
+ms_per_move = move_seconds[played] / move_counts[played] * 1000
+print("Belief update ms per move: " +
+      ", ".join(f"move {m + 1} {ms_per_move[m]:.3f}" for m in range(0, len(ms_per_move), 5)))
 
 # Labels and formatting
 plt.xlabel("Move Number")
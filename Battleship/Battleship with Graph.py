@@ -1,8 +1,7 @@
 import random
-import math
-import itertools
 import matplotlib.pyplot as plt
 import numpy as np
+from battleship_engine import FleetBelief
 
 # --- Config ---
 GRID_SIZE = 6
@@ -41,76 +40,21 @@ def place_ships_randomly():
     return board, ships
 
 # --- Entropy Calculation ---
-def all_possible_ship_placements(hits, misses):
-    positions = []
-    for size in SHIP_SIZES:
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE - size + 1):
-                pos = [(r, c + i) for i in range(size)]
-                if all((r, c + i) not in misses for i in range(size)):
-                    positions.append(pos)
-        for r in range(GRID_SIZE - size + 1):
-            for c in range(GRID_SIZE):
-                pos = [(r + i, c) for i in range(size)]
-                if all((r + i, c) not in misses for i in range(size)):
-                    positions.append(pos)
-    all_combos = []
-    for combo in itertools.combinations(positions, len(SHIP_SIZES)):
-        cells = set()
-        valid = True
-        for ship in combo:
-            for cell in ship:
-                if cell in cells:
-                    valid = False
-                    break
-                cells.add(cell)
-            if not valid:
-                break
-        if not valid:
-            continue
-        if all(any(hit in ship for ship in combo) for hit in hits):
-            all_combos.append(combo)
-    return all_combos
-
-def board_entropy(hits, misses):
-    combos = all_possible_ship_placements(hits, misses)
-    if not combos:
-        return 0.0
-    total = len(combos)
-    cell_probs = [[0.0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-    for combo in combos:
-        occupied = set(cell for ship in combo for cell in ship)
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                if (r, c) in occupied:
-                    cell_probs[r][c] += 1
-    for r in range(GRID_SIZE):
-        for c in range(GRID_SIZE):
-            cell_probs[r][c] /= total
-    entropy = 0.0
-    for r in range(GRID_SIZE):
-        for c in range(GRID_SIZE):
-            p = cell_probs[r][c]
-            if 0 < p < 1:
-                entropy -= p * math.log2(p) + (1 - p) * math.log2(1 - p)
-    return entropy
+# Every game starts from the same no-shot belief; each shot narrows a copy
+PRIOR = FleetBelief.from_fleet(SHIP_SIZES, GRID_SIZE)
 
 # --- Simulation ---
 def simulate_entropy_trace():
     board, ships = place_ships_randomly()
-    hits = set()
-    misses = set()
+    belief = PRIOR.copy()
     all_moves = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE)]
     random.shuffle(all_moves)
     entropies = []
 
     for move in all_moves[:NUM_MOVES]:
         r, c = move
-        if board[r][c] == 1:
-            hits.add((r, c))
-        else:
-            misses.add((r, c))
-        ent = board_entropy(hits, misses)
+        belief.observe(r, c, board[r][c] == 1)
+        ent = belief.entropy()
         entropies.append(ent)
     return entropies
 
@@ -1,6 +1,5 @@
 import random
-import math
-import itertools
+from battleship_engine import cell_entropy, cell_probabilities
 
 # --- Config ---
 GRID_SIZE = 6
@@ -54,64 +53,10 @@ def place_ships_randomly():
     return board, ships
 
 # --- Entropy Calculation ---
-def all_possible_ship_placements(hits, misses):
-    # Generate all possible non-overlapping placements for the ships, given hits/misses
-    positions = []
-    for size in SHIP_SIZES:
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE-size+1):
-                pos = [(r, c+i) for i in range(size)]
-                if all((r, c+i) not in misses for i in range(size)):
-                    positions.append(pos)
-        for r in range(GRID_SIZE-size+1):
-            for c in range(GRID_SIZE):
-                pos = [(r+i, c) for i in range(size)]
-                if all((r+i, c) not in misses for i in range(size)):
-                    positions.append(pos)
-    # Now, generate all combinations of ship placements (no overlap, all hits covered)
-    all_combos = []
-    for combo in itertools.combinations(positions, len(SHIP_SIZES)):
-        cells = set()
-        valid = True
-        for ship in combo:
-            for cell in ship:
-                if cell in cells:
-                    valid = False
-                    break
-                cells.add(cell)
-            if not valid:
-                break
-        if not valid:
-            continue
-        # All hits must be covered by some ship
-        if all(any(hit in ship for ship in combo) for hit in hits):
-            all_combos.append(combo)
-    return all_combos
-
 def board_entropy(hits, misses):
-    # For each cell, compute probability of being occupied by a ship
-    combos = all_possible_ship_placements(hits, misses)
-    if not combos:
-        return 0.0, [[0.0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-    cell_probs = [[0.0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-    for combo in combos:
-        occupied = set(cell for ship in combo for cell in ship)
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                if (r, c) in occupied:
-                    cell_probs[r][c] += 1
-    total = len(combos)
-    for r in range(GRID_SIZE):
-        for c in range(GRID_SIZE):
-            cell_probs[r][c] /= total
-    # Entropy per cell
-    entropy = 0.0
-    for r in range(GRID_SIZE):
-        for c in range(GRID_SIZE):
-            p = cell_probs[r][c]
-            if p > 0 and p < 1:
-                entropy -= p * math.log2(p) + (1-p) * math.log2(1-p)
-    return entropy, cell_probs
+    # Entropy and the probability that each cell holds a ship
+    cell_probs = cell_probabilities(SHIP_SIZES, GRID_SIZE, hits, misses)
+    return cell_entropy(cell_probs), cell_probs
 
 # --- Game Simulation ---
 def simulate_battleship():
@@ -0,0 +1,426 @@
+import concurrent.futures
+import os
+import time
+import numpy as np
+
+# Shared placement/probability engine for the Battleship scripts.
+# A set of cells is a bitboard: cell (r, c) is bit r*grid_size + c. Single
+# placements are Python ints; arrays of them are packed little-endian uint64
+# words, shape (n, ceil(cells/64)), so a 10x10 board is two words per row.
+# Miss filtering, overlap tests and hit coverage are bitwise AND/OR, and
+# per-cell counts come from unpacking the bits of a whole array at once.
+
+# --- 1. Bitboards ---
+def cell_bit(r, c, grid_size):
+    return 1 << (r * grid_size + c)
+
+def cells_mask(cells, grid_size):
+    mask = 0
+    for r, c in cells:
+        mask |= cell_bit(r, c, grid_size)
+    return mask
+
+def n_words(grid_size):
+    return -(-grid_size * grid_size // 64)
+
+def to_words(masks, grid_size):
+    # Python int masks -> (n, words) uint64 array
+    w = n_words(grid_size)
+    return np.array([[(m >> (64 * i)) & 0xFFFFFFFFFFFFFFFF for i in range(w)] for m in masks],
+                    dtype='<u8').reshape(-1, w)
+
+def cell_counts(boards, grid_size, block=1 << 16):
+    # Occupancy count of every cell over an (n, words) array, in blocks
+    counts = np.zeros(grid_size * grid_size, dtype=np.int64)
+    for start in range(0, len(boards), block):
+        chunk = np.ascontiguousarray(boards[start:start + block])
+        bits = np.unpackbits(chunk.view(np.uint8), axis=1, bitorder='little', count=grid_size * grid_size)
+        counts += bits.sum(axis=0, dtype=np.int64)
+    return counts
+
+# --- 2. Ship placements ---
+def ship_placements(size, grid_size):
+    # Every placement of one ship: horizontal first, then vertical
+    row = (1 << size) - 1
+    col = sum(1 << (i * grid_size) for i in range(size))
+    horizontal = [row << (r * grid_size + c) for r in range(grid_size) for c in range(grid_size - size + 1)]
+    vertical = [col << (r * grid_size + c) for r in range(grid_size - size + 1) for c in range(grid_size)]
+    return horizontal + vertical
+
+def fleet_placements(ship_sizes, grid_size, misses=0):
+    # Per ship, the placements that avoid every miss
+    return [[p for p in ship_placements(size, grid_size) if not p & misses] for size in ship_sizes]
+
+# --- 3. Consistent fleets ---
+# A fleet is one placement per ship, no two overlapping, and every hit must
+# be covered by some ship. Ships are placed largest first; ships of equal
+# size are interchangeable, so their placements are taken in increasing
+# index order and each fleet is counted once. Fleets are built one ship at
+# a time as an array join: every partial fleet x every placement of the next
+# ship, kept where the AND is zero.
+def join_blocks(boards, last, placements, ordered, block_pairs=1 << 22):
+    # Yields (boards, last) blocks of every partial fleet plus one more ship
+    rows = max(1, block_pairs // max(len(placements), 1))
+    for start in range(0, len(boards), rows):
+        b = boards[start:start + rows]
+        free = np.ones((len(b), len(placements)), dtype=bool)
+        for i in range(b.shape[1]):
+            free &= (b[:, None, i] & placements[None, :, i]) == 0
+        if ordered:
+            free &= np.arange(len(placements))[None, :] > last[start:start + rows, None]
+        fleet, idx = np.nonzero(free)
+        yield b[fleet] | placements[idx], idx
+
+def join_ship(boards, last, placements, ordered, block_pairs=1 << 22):
+    # (boards, last) after adding one ship to every partial fleet
+    blocks = list(join_blocks(boards, last, placements, ordered, block_pairs))
+    if not blocks:
+        return np.empty((0, boards.shape[1]), dtype='<u8'), np.empty(0, dtype=np.int64)
+    return np.concatenate([b for b, _ in blocks]), np.concatenate([idx for _, idx in blocks])
+
+def fleet_blocks(ship_sizes, grid_size, hits=(), misses=(), block_pairs=1 << 22):
+    # Yields the consistent fleets in blocks of bitboards. Only the partial
+    # fleets without the last ship are held in full.
+    sizes = sorted(ship_sizes, reverse=True)
+    hit_words = to_words([cells_mask(hits, grid_size)], grid_size)[0]
+    per_ship = [to_words(placements, grid_size)
+                for placements in fleet_placements(sizes, grid_size, cells_mask(misses, grid_size))]
+    boards = np.zeros((1, n_words(grid_size)), dtype='<u8')
+    last = np.full(1, -1, dtype=np.int64)
+    for k, placements in enumerate(per_ship[:-1]):
+        boards, last = join_ship(boards, last, placements, k > 0 and sizes[k] == sizes[k - 1], block_pairs)
+    ordered = len(sizes) > 1 and sizes[-1] == sizes[-2]
+    for block, _ in join_blocks(boards, last, per_ship[-1], ordered, block_pairs):
+        covered = np.ones(len(block), dtype=bool)
+        for i, word in enumerate(hit_words):
+            covered &= (block[:, i] & word) == word
+        yield block[covered]
+
+def consistent_fleets(ship_sizes, grid_size, hits=(), misses=()):
+    # (n, words) occupancy bitboards of every fleet consistent with the shots
+    blocks = list(fleet_blocks(ship_sizes, grid_size, hits, misses))
+    if not blocks:
+        return np.empty((0, n_words(grid_size)), dtype='<u8')
+    return np.concatenate(blocks)
+
+# --- 4. Counting fleets without storing them ---
+# The same fleets as consistent_fleets, counted by depth-first search over
+# Python int bitboards, one ship per level. Every level keeps the number of
+# completions below each of its placements, so working memory is one
+# counter per placement plus the search stack, however many fleets there
+# are. Hits left uncovered prune a branch as soon as the remaining ships are
+# too small to cover them. The last ship only looks at placements touching
+# the board (or covering the first uncovered hit), found from a per-cell
+# index, so a leaf costs a few set operations rather than one per placement.
+def fleet_cell_counts(ship_sizes, grid_size, hits=(), misses=()):
+    # (number of consistent fleets, per-cell occupancy counts)
+    sizes = sorted(ship_sizes, reverse=True)
+    hit_mask = cells_mask(hits, grid_size)
+    per_ship = fleet_placements(sizes, grid_size, cells_mask(misses, grid_size))
+    counts = [[0] * len(placements) for placements in per_ship]
+    remaining = [sum(sizes[k:]) for k in range(len(sizes))]
+    ordered = [k > 0 and sizes[k] == sizes[k - 1] for k in range(len(sizes))]
+    last = len(sizes) - 1
+    # Last-ship placement indexes covering each cell
+    covering = [[] for _ in range(grid_size * grid_size)]
+    for i, p in enumerate(per_ship[last]):
+        while p:
+            covering[(p & -p).bit_length() - 1].append(i)
+            p &= p - 1
+    from_start = [0] * (len(per_ship[last]) + 1)
+
+    def search(k, board, start):
+        uncovered = hit_mask & ~board
+        if uncovered.bit_count() > remaining[k]:
+            return 0
+        placements, c = per_ship[k], counts[k]
+        if k == last:
+            if not uncovered:
+                # Every placement from start on fits except those touching
+                # the board: add one to all of them lazily, take those back
+                blocked = set()
+                while board:
+                    blocked.update(covering[(board & -board).bit_length() - 1])
+                    board &= board - 1
+                blocked = [i for i in blocked if i >= start]
+                from_start[start] += 1
+                for i in blocked:
+                    c[i] -= 1
+                return len(placements) - start - len(blocked)
+            n = 0
+            for i in covering[(uncovered & -uncovered).bit_length() - 1]:
+                p = placements[i]
+                if i >= start and not p & board and p & uncovered == uncovered:
+                    c[i] += 1
+                    n += 1
+            return n
+        total = 0
+        for i in range(start, len(placements)):
+            p = placements[i]
+            if p & board:
+                continue
+            n = search(k + 1, board | p, i + 1 if ordered[k + 1] else 0)
+            if n:
+                c[i] += n
+                total += n
+        return total
+
+    fleets = search(0, 0, 0)
+    counts[last] = np.array(counts[last], dtype=np.int64) + np.cumsum(from_start[:-1])
+    cells = np.zeros(grid_size * grid_size, dtype=np.int64)
+    for placements, c in zip(per_ship, counts):
+        bits = np.unpackbits(to_words(placements, grid_size).view(np.uint8), axis=1,
+                             bitorder='little', count=grid_size * grid_size)
+        cells += np.array(c, dtype=np.int64) @ bits.astype(np.int64)
+    return fleets, cells
+
+# --- 5. Cell probabilities and entropy ---
+def cell_probabilities(ship_sizes, grid_size, hits=(), misses=()):
+    # (grid_size, grid_size) probability that each cell holds a ship
+    fleets, counts = fleet_cell_counts(ship_sizes, grid_size, hits, misses)
+    if fleets == 0:
+        return np.zeros((grid_size, grid_size))
+    return (counts / fleets).reshape(grid_size, grid_size)
+
+def boards_probabilities(boards, grid_size):
+    # cell_probabilities over an array of fleet bitboards
+    if len(boards) == 0:
+        return np.zeros((grid_size, grid_size))
+    return (cell_counts(boards, grid_size) / len(boards)).reshape(grid_size, grid_size)
+
+def binary_entropy(p):
+    # Elementwise hit/miss entropy in bits; 0 for certain cells
+    p = np.asarray(p, dtype=np.float64)
+    q = np.where((p > 0) & (p < 1), p, 0.5)
+    return np.where((p > 0) & (p < 1), -(q * np.log2(q) + (1 - q) * np.log2(1 - q)), 0.0)
+
+def cell_entropy(cell_probs):
+    # Sum of every cell's hit/miss entropy, in bits
+    return float(binary_entropy(cell_probs).sum())
+
+def board_entropy(ship_sizes, grid_size, hits=(), misses=()):
+    # (entropy, cell_probs) of the board given the shots so far
+    probs = cell_probabilities(ship_sizes, grid_size, hits, misses)
+    return cell_entropy(probs), probs
+
+# --- 6. Expected information gain ---
+# One enumeration serves every possible next shot. together[x, y] counts the
+# fleets occupying both x and y, so the fleets split by whether x is
+# occupied give the two posteriors directly: after a hit at x, y is occupied
+# with probability together[x, y] / together[x, x]; after a miss, with
+# (together[y, y] - together[x, y]) / (fleets - together[x, x]).
+def cooccupancy_counts(ship_sizes, grid_size, hits=(), misses=(), block=1 << 14):
+    # (fleets, (cells, cells) counts of fleets occupying both cells)
+    cells = grid_size * grid_size
+    together = np.zeros((cells, cells), dtype=np.int64)
+    fleets = 0
+    for boards in fleet_blocks(ship_sizes, grid_size, hits, misses):
+        fleets += len(boards)
+        for start in range(0, len(boards), block):
+            chunk = np.ascontiguousarray(boards[start:start + block])
+            bits = np.unpackbits(chunk.view(np.uint8), axis=1, bitorder='little', count=cells)
+            # float32 BLAS is exact here: every entry is at most block
+            bits = bits.astype(np.float32)
+            together += (bits.T @ bits).astype(np.int64)
+    return fleets, together
+
+def gain_from_cooccupancy(fleets, together, grid_size, fired=()):
+    # Information-gain map from a (possibly weighted) fleet total and
+    # co-occupancy matrix; cells in fired are set to 0
+    if fleets == 0:
+        return np.zeros((grid_size, grid_size))
+    occupied = np.diag(together).astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        after_hit = binary_entropy(together / occupied[:, None]).sum(axis=1)
+        after_miss = binary_entropy((occupied[None, :] - together) / (fleets - occupied)[:, None]).sum(axis=1)
+    p_hit = occupied / fleets
+    expected = np.where(p_hit > 0, p_hit * after_hit, 0.0) + np.where(p_hit < 1, (1 - p_hit) * after_miss, 0.0)
+    gain = cell_entropy(p_hit) - expected
+    for r, c in fired:
+        gain[r * grid_size + c] = 0.0
+    return gain.reshape(grid_size, grid_size)
+
+def information_gain_map(ship_sizes, grid_size, hits=(), misses=()):
+    # (grid_size, grid_size) expected entropy drop from firing at each cell;
+    # 0 for cells already fired at
+    fleets, together = cooccupancy_counts(ship_sizes, grid_size, hits, misses)
+    return gain_from_cooccupancy(fleets, together, grid_size, list(hits) + list(misses))
+
+# --- 7. Monte Carlo estimates for large fleets ---
+# Exact counting is out of reach for fleets like 5, 4, 3, 3, 2 on 10x10, so
+# fleets are sampled instead, by sequential importance sampling over a batch
+# of samples at once. Ships are placed largest first, each uniformly among
+# the placements that fit the board so far, except that with probability
+# HIT_PROPOSAL a ship is placed over a hit not yet covered (when it can be).
+# Each sample is weighted by 1 / its proposal probability and by whether
+# every hit ends up covered, which makes the weighted samples uniform over
+# consistent fleets. Estimates are self-normalized weighted means; standard
+# errors use the delta method. Batches run until the sample or time budget
+# is spent, on a process pool; workers return sums that merge by addition.
+HIT_PROPOSAL = 0.5
+SAMPLE_BATCH = 4096
+
+def placement_bits(placements, grid_size):
+    # (P, cells) 0/1 float32 matrix of the cells each placement covers
+    return np.unpackbits(to_words(placements, grid_size).view(np.uint8), axis=1, bitorder='little',
+                         count=grid_size * grid_size).astype(np.float32)
+
+def sample_fleets(per_ship, hit_cells, batch, rng):
+    # (occupancy, weights) of one batch of fleets. per_ship holds (P, cells)
+    # placement_bits; overlaps and hit coverage are 0/1 matmuls against them.
+    occupied = np.zeros((batch, per_ship[0].shape[1]), dtype=np.float32)
+    hits = np.zeros(per_ship[0].shape[1], dtype=np.float32)
+    hits[hit_cells] = 1
+    weights = np.ones(batch)
+    rows = np.arange(batch)
+    for placements in per_ship:
+        free = (occupied @ placements.T) == 0
+        if len(hit_cells):
+            cover = free & (((1 - occupied) * hits) @ placements.T > 0)
+        else:
+            cover = np.zeros_like(free)
+        n_free = free.sum(axis=1)
+        n_cover = cover.sum(axis=1)
+        use_cover = (n_cover > 0) & (rng.random(batch) < HIT_PROPOSAL)
+        keys = np.where(np.where(use_cover[:, None], cover, free), rng.random(free.shape, dtype=np.float32), -1)
+        idx = keys.argmax(axis=1)
+        share = np.where(n_cover > 0, HIT_PROPOSAL, 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            q = (1 - share) / n_free + np.where(cover[rows, idx], share / n_cover, 0.0)
+            weights *= np.where(n_free > 0, 1 / q, 0.0)
+        occupied += placements[idx]
+    weights *= occupied[:, hit_cells].all(axis=1)
+    # Overlapping (dead) samples have weight 0; keep their rows 0/1 anyway
+    return np.minimum(occupied, 1), weights
+
+def sample_stats(per_ship, hit_cells, samples, deadline, seed):
+    # Weighted sums over up to `samples` fleets, stopping at the deadline
+    rng = np.random.default_rng(seed)
+    cells = per_ship[0].shape[1]
+    stats = {"samples": 0, "w": 0.0, "w2": 0.0, "wo": np.zeros(cells), "w2o": np.zeros(cells),
+             "woo": np.zeros((cells, cells))}
+    while stats["samples"] < samples and (deadline is None or time.time() < deadline):
+        batch = min(SAMPLE_BATCH, samples - stats["samples"])
+        occupied, w = sample_fleets(per_ship, hit_cells, batch, rng)
+        occupied = occupied.astype(np.float64)
+        stats["samples"] += batch
+        stats["w"] += w.sum()
+        stats["w2"] += (w * w).sum()
+        stats["wo"] += w @ occupied
+        stats["w2o"] += (w * w) @ occupied
+        stats["woo"] += (occupied * w[:, None]).T @ occupied
+    return stats
+
+def merge_stats(total, stats):
+    for name, value in stats.items():
+        total[name] = total[name] + value if name in total else value
+    return total
+
+class SampledBoard:
+    # Monte Carlo estimate of the posterior over fleets given the shots
+    def __init__(self, grid_size, stats, seconds, workers, fired=()):
+        self.grid_size = grid_size
+        self.samples = stats["samples"]
+        self.seconds = seconds
+        self.workers = workers
+        self.fired = list(fired)
+        w, w2 = stats["w"], stats["w2"]
+        # Kish effective sample size of the weights
+        self.effective = w * w / w2 if w2 else 0.0
+        self.weight = w
+        self.together = stats["woo"]
+        shape = (grid_size, grid_size)
+        if w == 0:
+            self.cell_probs = np.zeros(shape)
+            self.stderr = np.full(shape, np.nan)
+            return
+        p = stats["wo"] / w
+        var = (stats["w2o"] - 2 * p * stats["w2o"] + p * p * w2) / (w * w)
+        self.cell_probs = p.reshape(shape)
+        self.stderr = np.sqrt(np.maximum(var, 0.0)).reshape(shape)
+
+    def entropy(self):
+        return cell_entropy(self.cell_probs)
+
+    def information_gain(self):
+        return gain_from_cooccupancy(self.weight, self.together, self.grid_size, self.fired)
+
+    def max_stderr(self):
+        # None when no sampled fleet was consistent with the shots
+        return float(self.stderr.max()) if self.weight else None
+
+    def summary(self):
+        text = (f"{self.samples:,} sampled fleets ({self.effective:,.0f} effective) in {self.seconds:.2f} s "
+                f"on {self.workers} worker(s), ")
+        if not self.weight:
+            return text + "none consistent with the shots"
+        return text + f"max cell standard error {self.max_stderr():.4f}"
+
+def sample_board(ship_sizes, grid_size, hits=(), misses=(), samples=200_000, seconds=None,
+                 workers=None, seed=None):
+    # SampledBoard from up to `samples` fleets, or as many as fit in `seconds`
+    t0 = time.perf_counter()
+    workers = max(1, min(workers or os.cpu_count(), -(-samples // SAMPLE_BATCH)))
+    sizes = sorted(ship_sizes, reverse=True)
+    per_ship = [placement_bits(p, grid_size)
+                for p in fleet_placements(sizes, grid_size, cells_mask(misses, grid_size))]
+    hit_cells = np.array(sorted(r * grid_size + c for r, c in hits), dtype=np.int64)
+    deadline = time.time() + seconds if seconds is not None else None
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    shares = [samples // workers + (i < samples % workers) for i in range(workers)]
+    if workers == 1:
+        stats = sample_stats(per_ship, hit_cells, samples, deadline, seeds[0])
+    else:
+        stats = {}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            jobs = [executor.submit(sample_stats, per_ship, hit_cells, n, deadline, s)
+                    for n, s in zip(shares, seeds)]
+            for job in jobs:
+                merge_stats(stats, job.result())
+    return SampledBoard(grid_size, stats, time.perf_counter() - t0, workers, list(hits) + list(misses))
+
+# --- 8. Belief carried across moves ---
+# A game's shots only ever remove fleets, so the consistent set is kept as
+# bitboards and each shot filters it by that cell's bit, together with the
+# per-cell counts. The counts are updated from whichever side of the split
+# is smaller (recounting the kept fleets, or subtracting the dropped ones),
+# so a move costs no more than the fleets it touches and gets cheaper as the
+# game narrows down. The no-shot enumeration is the same for every game:
+# build it once and start each game from a copy.
+class FleetBelief:
+    def __init__(self, grid_size, boards, counts=None):
+        self.grid_size = grid_size
+        self.boards = boards
+        self.counts = cell_counts(boards, grid_size) if counts is None else counts
+
+    @classmethod
+    def from_fleet(cls, ship_sizes, grid_size, hits=(), misses=()):
+        return cls(grid_size, consistent_fleets(ship_sizes, grid_size, hits, misses))
+
+    def copy(self):
+        # Observations replace the arrays rather than write to them, so
+        # copies can share them
+        return FleetBelief(self.grid_size, self.boards, self.counts)
+
+    def __len__(self):
+        return len(self.boards)
+
+    def observe(self, r, c, hit):
+        word, shift = divmod(r * self.grid_size + c, 64)
+        keep = ((self.boards[:, word] >> np.uint64(shift)) & np.uint64(1)).astype(bool)
+        if not hit:
+            keep = ~keep
+        kept = int(np.count_nonzero(keep))
+        if kept <= len(self.boards) - kept:
+            self.counts = cell_counts(self.boards[keep], self.grid_size)
+        else:
+            self.counts = self.counts - cell_counts(self.boards[~keep], self.grid_size)
+        self.boards = self.boards[keep]
+
+    def cell_probabilities(self):
+        if len(self.boards) == 0:
+            return np.zeros((self.grid_size, self.grid_size))
+        return (self.counts / len(self.boards)).reshape(self.grid_size, self.grid_size)
+
+    def entropy(self):
+        return cell_entropy(self.cell_probabilities())
@@ -1,67 +1,52 @@
-TARGETS = [
-"the", "and", "for", "are", "you", "was", "not", "but", "all", "can",
-"had", "his", "her", "one", "out", "has", "who", "she", "how", "now",
-"see", "him", "new", "any", "way", "our", "may", "get", "too", "two",
-"man", "did", "old", "big", "say", "boy", "use", "off", "let", "top",
-"end", "red", "its", "war", "run", "day", "god", "try", "yet", "set",
-"car", "dog", "eat", "sun", "win", "job", "law", "key", "bad", "fun",
-"pay", "act", "bed", "low", "sea", "hot", "yes", "box", "bar", "bag",
-"gas", "cut", "sit", "arm", "mom", "dad", "leg", "die", "dry", "cat",
-"cup", "net", "far", "toe", "ten", "aid", "age", "air", "aim", "art",
-"ask", "bit", "bow", "buy", "cap", "cry", "dig", "dot", "fan", "fat",
-"fit", "fix", "fly", "fun", "gap", "gun", "hit", "hop", "ice", "jam",
-"jar", "kit", "lay", "lie", "lip", "mad", "man", "map", "mat", "mix",
-"mud", "nap", "net", "nod", "off", "oil", "pad", "pan", "pen", "pet",
-"pit", "pop", "pot", "rag", "rat", "rip", "rob", "rod", "row", "rub",
-"run", "sad", "saw", "say", "see", "set", "shy", "sip", "sit", "ski",
-"sky", "son", "spy", "tag", "tap", "tax", "tea", "tip", "toe", "top",
-"toy", "try", "tug", "use", "van", "vet", "war", "wax", "way", "web",
-"wet", "who", "why", "wig", "win", "wow", "yes", "yet", "zip", "zoo",
-"ash", "ate", "ban", "bay", "bee", "beg", "bet", "bin", "bob", "bug",
-"bus", "cab", "cam", "can", "cap", "cop", "cow", "cub", "cue", "dam",
-"den", "dew", "dim", "dip", "don", "dub", "dug", "ear", "eel", "egg",
-"elf", "elk", "elm", "emo", "emu", "era", "eve", "fan", "fee", "fig",
-"fin", "fir", "foe", "fog", "fry", "fur", "gem", "get", "gig", "gin",
-"gnu", "goa", "gum", "gut", "gym", "hen", "hip", "hog", "hop", "ice",
-"ill", "inn", "ion", "irk", "ivy", "jab", "jog", "jot", "joy", "jug",
-"ken", "kin", "kit", "lab", "lad", "lag", "lap", "law", "lay", "lee",
-"leg", "let", "lid", "log", "lot", "mad", "man", "map", "mat", "max",
-"men", "met", "mob", "mod", "mom", "mop", "mud", "nag", "net", "nip",
-"nod", "nun", "oak", "oar", "odd", "off", "oil", "one", "opt", "orb",
-"ore", "owl", "pad", "pal", "pan", "par", "pat", "paw", "pay", "pea",
-"pen", "pet", "pie", "pig", "pin", "pit", "pod", "pop", "pot", "pro",
-"pub", "pun", "pus", "put", "rag", "ram", "ran", "rap", "rat", "raw",
-"ray", "red", "rib", "rid", "rig", "rim", "rip", "rob", "rod", "row",
-"rub", "rug", "rum", "run", "rye", "sad", "sag", "sap", "sat", "saw",
-"say", "sea", "see", "set", "sew", "she", "shy", "sin", "sip", "sir",
-"sit", "ski", "sky", "sly", "sob", "son", "sow", "soy", "spa", "spy",
-"sub", "sue", "sum", "sun", "tab", "tag", "tan", "tap", "tar", "tax",
-"tea", "ten", "the", "thy", "tie", "tip", "toe", "ton", "top", "toy",
-"try", "tub", "tug", "urn", "use", "van", "vet", "vow", "war", "was",
-"wax", "way", "web", "wed", "wee", "wet", "who", "why", "wig", "win",
-"wit", "woe", "won", "wow", "yak", "yam", "yap", "yaw", "yay", "yep",
-"yes", "yet", "yew", "yup", "zap", "zen", "zip", "zit", "zoo"
-]
+import os
+from wordle_engine import headless_mode, load_word_list, word_list_summary, write_results
+from wordle_letters import ALPHABET, LetterStats, analyze_file, print_summary
 
-import matplotlib.pyplot as plt
-from collections import Counter
+# Headless mode (--headless or WORDLE_HEADLESS=1) writes the counts to
+# RESULTS_FILE instead of plotting them, and never imports matplotlib
+HEADLESS = headless_mode()
+RESULTS_FILE = "3-letter distribution results.json"
+# One word per line. The list is loaded with duplicates and invalid lines
+# dropped; set STREAM to count a file of any size in fixed-size blocks instead
+# (duplicates are then counted every time they appear)
+WORD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words", "3-letter.txt")
+STREAM = False
 
-# Flatten all letters from all words into a single list
-all_letters = [letter for word in TARGETS for letter in word]
-
-# Count frequency of each letter
-letter_counts = Counter(all_letters)
+# Per-position, letter-pair and repeated-letter counts
+if STREAM:
+    stats = analyze_file(WORD_FILE, 3)
+else:
+    TARGET_CODES, WORD_LIST_INFO = load_word_list(WORD_FILE, 3)
+    print(word_list_summary(WORD_LIST_INFO))
+    stats = LetterStats(3)
+    stats.update_words(TARGET_CODES)
+letter_counts = stats.letter_counts()
 
 # Sort letters alphabetically for the plot
-letters = sorted(letter_counts)
+letters = sorted(letter for letter in letter_counts if letter_counts[letter])
 frequencies = [letter_counts[letter] for letter in letters]
+print_summary(stats)
+
+if HEADLESS:
+    write_results(RESULTS_FILE, stats.to_dict())
+    print(f"Wrote {RESULTS_FILE}")
+else:
+    # Plot
+    import matplotlib.pyplot as plt
+    plt.figure(figsize=(12, 6))
+    plt.bar(letters, frequencies, color='skyblue')
+    plt.xlabel('Letter')
+    plt.ylabel('Frequency')
+    plt.title('Letter Distribution in 3-Letter Word Dataset')
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+    plt.tight_layout()
 
-# Plot
-plt.figure(figsize=(12, 6))
-plt.bar(letters, frequencies, color='skyblue')
-plt.xlabel('Letter')
-plt.ylabel('Frequency')
-plt.title('Letter Distribution in 3-Letter Word Dataset')
-plt.grid(axis='y', linestyle='--', alpha=0.7)
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+    # Letter frequency by position
+    plt.figure(figsize=(12, 4))
+    plt.imshow(stats.position, aspect='auto', cmap='Blues')
+    plt.xticks(range(26), list(ALPHABET))
+    plt.yticks(range(3), [f"Position {p + 1}" for p in range(3)])
+    plt.colorbar(label='Frequency')
+    plt.title('Letter Frequency by Position in 3-Letter Word Dataset')
+    plt.tight_layout()
+    plt.show()
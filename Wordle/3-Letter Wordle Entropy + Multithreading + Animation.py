@@ -1,177 +1,59 @@
-import itertools
-import math
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from collections import Counter
-import concurrent.futures
 import os
+from wordle_engine import headless_mode, profiling_mode
+from wordle_solver import run_solver
 
-# --- 1. Word list ---
-TARGETS = [
-"the", "and", "for", "are", "you", "was", "not", "but", "all", "can",
-"had", "his", "her", "one", "out", "has", "who", "she", "how", "now",
-"see", "him", "new", "any", "way", "our", "may", "get", "too", "two",
-"man", "did", "old", "big", "say", "boy", "use", "off", "let", "top",
-"end", "red", "its", "war", "run", "day", "god", "try", "yet", "set",
-"car", "dog", "eat", "sun", "win", "job", "law", "key", "bad", "fun",
-"pay", "act", "bed", "low", "sea", "hot", "yes", "box", "bar", "bag",
-"gas", "cut", "sit", "arm", "mom", "dad", "leg", "die", "dry", "cat",
-"cup", "net", "far", "toe", "ten", "aid", "age", "air", "aim", "art",
-"ask", "bit", "bow", "buy", "cap", "cry", "dig", "dot", "fan", "fat",
-"fit", "fix", "fly", "fun", "gap", "gun", "hit", "hop", "ice", "jam",
-"jar", "kit", "lay", "lie", "lip", "mad", "man", "map", "mat", "mix",
-"mud", "nap", "net", "nod", "off", "oil", "pad", "pan", "pen", "pet",
-"pit", "pop", "pot", "rag", "rat", "rip", "rob", "rod", "row", "rub",
-"run", "sad", "saw", "say", "see", "set", "shy", "sip", "sit", "ski",
-"sky", "son", "spy", "tag", "tap", "tax", "tea", "tip", "toe", "top",
-"toy", "try", "tug", "use", "van", "vet", "war", "wax", "way", "web",
-"wet", "who", "why", "wig", "win", "wow", "yes", "yet", "zip", "zoo",
-"ash", "ate", "ban", "bay", "bee", "beg", "bet", "bin", "bob", "bug",
-"bus", "cab", "cam", "can", "cap", "cop", "cow", "cub", "cue", "dam",
-"den", "dew", "dim", "dip", "don", "dub", "dug", "ear", "eel", "egg",
-"elf", "elk", "elm", "emo", "emu", "era", "eve", "fan", "fee", "fig",
-"fin", "fir", "foe", "fog", "fry", "fur", "gem", "get", "gig", "gin",
-"gnu", "goa", "gum", "gut", "gym", "hen", "hip", "hog", "hop", "ice",
-"ill", "inn", "ion", "irk", "ivy", "jab", "jog", "jot", "joy", "jug",
-"ken", "kin", "kit", "lab", "lad", "lag", "lap", "law", "lay", "lee",
-"leg", "let", "lid", "log", "lot", "mad", "man", "map", "mat", "max",
-"men", "met", "mob", "mod", "mom", "mop", "mud", "nag", "net", "nip",
-"nod", "nun", "oak", "oar", "odd", "off", "oil", "one", "opt", "orb",
-"ore", "owl", "pad", "pal", "pan", "par", "pat", "paw", "pay", "pea",
-"pen", "pet", "pie", "pig", "pin", "pit", "pod", "pop", "pot", "pro",
-"pub", "pun", "pus", "put", "rag", "ram", "ran", "rap", "rat", "raw",
-"ray", "red", "rib", "rid", "rig", "rim", "rip", "rob", "rod", "row",
-"rub", "rug", "rum", "run", "rye", "sad", "sag", "sap", "sat", "saw",
-"say", "sea", "see", "set", "sew", "she", "shy", "sin", "sip", "sir",
-"sit", "ski", "sky", "sly", "sob", "son", "sow", "soy", "spa", "spy",
-"sub", "sue", "sum", "sun", "tab", "tag", "tan", "tap", "tar", "tax",
-"tea", "ten", "the", "thy", "tie", "tip", "toe", "ton", "top", "toy",
-"try", "tub", "tug", "urn", "use", "van", "vet", "vow", "war", "was",
-"wax", "way", "web", "wed", "wee", "wet", "who", "why", "wig", "win",
-"wit", "woe", "won", "wow", "yak", "yam", "yap", "yaw", "yay", "yep",
-"yes", "yet", "yew", "yup", "zap", "zen", "zip", "zit", "zoo"
-]
-GUESSES = TARGETS.copy()
-
-# --- 2. Feedback function (green=2, yellow=1, gray=0) ---
-def score_feedback(guess, target):
-    fb = [0]*3
-    used = [False]*3
-    for i in range(3):
-        if guess[i] == target[i]:
-            fb[i] = 2
-            used[i] = True
-    for i in range(3):
-        if fb[i] == 0:
-            for j in range(3):
-                if not used[j] and guess[i] == target[j]:
-                    fb[i] = 1
-                    used[j] = True
-                    break
-    return tuple(fb)
-
-# --- 3. Entropy calculation ---
-def expected_entropy(guess, candidates):
-    patterns = Counter(score_feedback(guess, target) for target in candidates)
-    total = len(candidates)
-    ent = 0.0
-    for count in patterns.values():
-        p = count / total
-        ent -= p * math.log2(p)
-    return ent
-
-# --- 4. Game simulation with entropy tracking ---
-def simulate_game(secret):
-    candidates = TARGETS.copy()
-    history = []
-    entropy_trace = []
-    while True:
-        guess = max(candidates, key=lambda g: expected_entropy(g, candidates))
-        fb = score_feedback(guess, secret)
-        ent = expected_entropy(guess, candidates)
-        entropy_trace.append(ent)
-        history.append((guess, fb))
-        if fb == (2, 2, 2):
-            return history, entropy_trace
-        candidates = [w for w in candidates if score_feedback(guess, w) == fb]
+# Solves every 3-letter word with the greedy-entropy (or lookahead) solver,
+# in parallel, then writes the results or animates the entropy traces. The
+# solver itself lives in wordle_solver.run_solver; this file is its config.
 
-
-# --- 5. Simulate all games and record entropy paths (parallelized) ---
-def simulate_game_entropy(word):
-    _, entropies = simulate_game(word)
-    return entropies
+# --- 1. Word list ---
+# One word per line; duplicates and invalid lines are dropped at load time.
+WORD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words", "3-letter.txt")
+# Answers come first so target i is also guess row i. Non-answer words that
+# may still be played (e.g. other valid three-letter words) go in EXTRA_GUESSES.
+EXTRA_GUESSES = []
+
+# --- 2. Solver ---
+# "candidates": only guess words that could still be the answer
+# "all": score every word in GUESSES each turn, in memory-bounded blocks
+GUESS_POOL = "candidates"
+# Working memory (MB) for the blocked feedback-table and entropy kernels
+MEMORY_CAP_MB = 256
+# Hard mode: greens stay in place and revealed letters must be reused. Every
+# remaining candidate already obeys that, so it only changes GUESS_POOL = "all"
+HARD_MODE = False
+# "greedy": maximize expected entropy each turn
+# "lookahead": minimize expected turns, searching the top-k guesses a few plies deep
+SOLVER = "greedy"
+LOOKAHEAD_TOP_K = 10
+LOOKAHEAD_DEPTH = 2
+STRATEGY_FILE = "3-letter lookahead strategy.json"
+# How many starting words and two-word openings to rank. The pair search is
+# off by default: for 5 letters it takes ~20 s, far longer than the solve
+TOP_OPENERS = 10
+TOP_OPENING_PAIRS = 0
+# Profiling (--profile or WORDLE_PROFILE=1) reports per-turn time, patterns
+# scored, candidate sizes and cache hit ratios of the solver loop
+PROFILE = profiling_mode()
+
+# --- 3. Output ---
+# Headless batch mode (--headless or WORDLE_HEADLESS=1) writes the results to
+# RESULTS_FILE instead of plotting, and never imports matplotlib
+HEADLESS = headless_mode()
+RESULTS_FILE = "3-letter results.json"
+# Columnar per-game results (.npz, memory-mappable with wordle_results.load_results)
+GAMES_FILE = "3-letter games.npz"
+# Otherwise the trace animation is written here (.gif, or .mp4 with ffmpeg installed)
+ANIMATION_FILE = "3-letter entropy traces.gif"
+# Plot shown after the animation: "traces" (every game) or "average"
+PLOT = "traces"
 
 if __name__ == "__main__":
-    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
-        entropy_logs = list(executor.map(simulate_game_entropy, TARGETS))
-
-    # --- 6. Compute average entropy per turn ---
-    max_turns = max(len(log) for log in entropy_logs)
-    avg_entropy_by_turn = []
-    for i in range(max_turns):
-        turn_vals = [log[i] for log in entropy_logs if i < len(log)]
-        avg_entropy_by_turn.append(sum(turn_vals) / len(turn_vals))
-
-    # --- Print Top 10 starting words by expected entropy ---
-    print("Top 10 starting words by expected entropy (higher is better):")
-    start_entropies = []
-    for word in TARGETS:
-        ent = expected_entropy(word, TARGETS)
-        start_entropies.append((ent, word))
-    start_entropies.sort(reverse=True)
-    for rank, (ent, word) in enumerate(start_entropies[:10], 1):
-        print(f"{rank:2d}. {word}  ({ent:.4f} bits)")
-
-    # --- 7a. Animate average entropy drop ---
-    fig1, ax1 = plt.subplots(figsize=(8,5))
-    ax1.set_xlim(0.5, len(avg_entropy_by_turn) + 0.5)
-    ax1.set_ylim(0, max(avg_entropy_by_turn) + 0.5)
-    line, = ax1.plot([], [], marker='o', color='blue')
-    ax1.set_title("Entropy Drop While Solving 3-Letter Wordle (Average)")
-    ax1.set_xlabel("Turn")
-    ax1.set_ylabel("Expected Entropy (bits)")
-    ax1.grid(True)
-
-    xdata, ydata = [], []
-
-    lines = []
-    avg_line, = ax1.plot([], [], lw=3, color='blue', label='Average Entropy')
-
-    def init():
-        return lines + [avg_line]
-
-    def update(frame):
-        if frame < len(entropy_logs):
-            trace = entropy_logs[frame]
-            x = list(range(1, len(trace)+1))
-            y = trace
-            line, = ax1.plot(x, y, color='gray', alpha=0.2)
-            lines.append(line)
-        x_avg = list(range(1, len(avg_entropy_by_turn)+1))
-        y_avg = avg_entropy_by_turn
-        avg_line.set_data(x_avg, y_avg)
-        return lines + [avg_line]
-
-    ani = animation.FuncAnimation(
-        fig1, update, frames=len(entropy_logs),
-        init_func=init, blit=True, interval=10, repeat=False
-    )
-
-    # --- 7b. Plot all entropy traces for all games ---
-    fig2, ax2 = plt.subplots(figsize=(8,5))
-    for trace in entropy_logs:
-        ax2.plot(range(1, len(trace)+1), trace, color='gray', alpha=0.2)
-    ax2.plot(range(1, len(avg_entropy_by_turn)+1), avg_entropy_by_turn, color='blue', label='Average')
-    ax2.set_title("Entropy Traces for All Games (3-Letter Wordle)")
-    ax2.set_xlabel("Turn")
-    ax2.set_ylabel("Expected Entropy (bits)")
-    ax2.grid(True)
-    ax2.legend()
-
-    # Show both figures simultaneously
-    fig1.show()
-    fig2.show()
-    import time
-    # Give time for both windows to appear before script exits
-    plt.pause(0.1)
-    input("Press Enter to close plots...")
\ No newline at end of file
+    run_solver(3, WORD_FILE, {
+        "extra_guesses": EXTRA_GUESSES, "guess_pool": GUESS_POOL, "memory_cap_mb": MEMORY_CAP_MB,
+        "hard_mode": HARD_MODE,
+        "solver": SOLVER, "lookahead_top_k": LOOKAHEAD_TOP_K, "lookahead_depth": LOOKAHEAD_DEPTH,
+        "strategy_file": STRATEGY_FILE, "top_openers": TOP_OPENERS, "top_opening_pairs": TOP_OPENING_PAIRS,
+        "profile": PROFILE, "headless": HEADLESS, "results_file": RESULTS_FILE, "games_file": GAMES_FILE,
+        "animation_file": ANIMATION_FILE, "plot": PLOT,
+    })
@@ -1,110 +1,92 @@
-import math
-import matplotlib.pyplot as plt
-from collections import Counter
+import os
 import random
+from wordle_engine import (HardMode, HintEngine, cached_feedback_matrix, decode_words, headless_mode, load_word_list,
+                           pattern_entropy, pattern_to_tuple, solved_pattern, write_results)
 
 # --- 1. Word list ---
-TARGETS = [
-"the", "and", "for", "are", "you", "was", "not", "but", "all", "can",
-"had", "his", "her", "one", "out", "has", "who", "she", "how", "now",
-"see", "him", "new", "any", "way", "our", "may", "get", "too", "two",
-"man", "did", "old", "big", "say", "boy", "use", "off", "let", "top",
-"end", "red", "its", "war", "run", "day", "god", "try", "yet", "set",
-"car", "dog", "eat", "sun", "win", "job", "law", "key", "bad", "fun",
-"pay", "act", "bed", "low", "sea", "hot", "yes", "box", "bar", "bag",
-"gas", "cut", "sit", "arm", "mom", "dad", "leg", "die", "dry", "cat",
-"cup", "net", "far", "toe", "ten", "aid", "age", "air", "aim", "art",
-"ask", "bit", "bow", "buy", "cap", "cry", "dig", "dot", "fan", "fat",
-"fit", "fix", "fly", "fun", "gap", "gun", "hit", "hop", "ice", "jam",
-"jar", "kit", "lay", "lie", "lip", "mad", "man", "map", "mat", "mix",
-"mud", "nap", "net", "nod", "off", "oil", "pad", "pan", "pen", "pet",
-"pit", "pop", "pot", "rag", "rat", "rip", "rob", "rod", "row", "rub",
-"run", "sad", "saw", "say", "see", "set", "shy", "sip", "sit", "ski",
-"sky", "son", "spy", "tag", "tap", "tax", "tea", "tip", "toe", "top",
-"toy", "try", "tug", "use", "van", "vet", "war", "wax", "way", "web",
-"wet", "who", "why", "wig", "win", "wow", "yes", "yet", "zip", "zoo",
-"ash", "ate", "ban", "bay", "bee", "beg", "bet", "bin", "bob", "bug",
-"bus", "cab", "cam", "can", "cap", "cop", "cow", "cub", "cue", "dam",
-"den", "dew", "dim", "dip", "don", "dub", "dug", "ear", "eel", "egg",
-"elf", "elk", "elm", "emo", "emu", "era", "eve", "fan", "fee", "fig",
-"fin", "fir", "foe", "fog", "fry", "fur", "gem", "get", "gig", "gin",
-"gnu", "goa", "gum", "gut", "gym", "hen", "hip", "hog", "hop", "ice",
-"ill", "inn", "ion", "irk", "ivy", "jab", "jog", "jot", "joy", "jug",
-"ken", "kin", "kit", "lab", "lad", "lag", "lap", "law", "lay", "lee",
-"leg", "let", "lid", "log", "lot", "mad", "man", "map", "mat", "max",
-"men", "met", "mob", "mod", "mom", "mop", "mud", "nag", "net", "nip",
-"nod", "nun", "oak", "oar", "odd", "off", "oil", "one", "opt", "orb",
-"ore", "owl", "pad", "pal", "pan", "par", "pat", "paw", "pay", "pea",
-"pen", "pet", "pie", "pig", "pin", "pit", "pod", "pop", "pot", "pro",
-"pub", "pun", "pus", "put", "rag", "ram", "ran", "rap", "rat", "raw",
-"ray", "red", "rib", "rid", "rig", "rim", "rip", "rob", "rod", "row",
-"rub", "rug", "rum", "run", "rye", "sad", "sag", "sap", "sat", "saw",
-"say", "sea", "see", "set", "sew", "she", "shy", "sin", "sip", "sir",
-"sit", "ski", "sky", "sly", "sob", "son", "sow", "soy", "spa", "spy",
-"sub", "sue", "sum", "sun", "tab", "tag", "tan", "tap", "tar", "tax",
-"tea", "ten", "the", "thy", "tie", "tip", "toe", "ton", "top", "toy",
-"try", "tub", "tug", "urn", "use", "van", "vet", "vow", "war", "was",
-"wax", "way", "web", "wed", "wee", "wet", "who", "why", "wig", "win",
-"wit", "woe", "won", "wow", "yak", "yam", "yap", "yaw", "yay", "yep",
-"yes", "yet", "yew", "yup", "zap", "zen", "zip", "zit", "zoo"
-]
+# One word per line; duplicates and invalid lines are dropped at load time
+WORD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words", "3-letter.txt")
+TARGET_CODES, WORD_LIST_INFO = load_word_list(WORD_FILE, 3)
+TARGETS = decode_words(TARGET_CODES)
 GUESSES = TARGETS.copy()
+# Hard mode: greens must stay in place and revealed letters must be reused
+HARD_MODE = False
+# Headless mode (--headless or WORDLE_HEADLESS=1) writes the entropy trace to
+# RESULTS_FILE instead of plotting it, and never imports matplotlib
+HEADLESS = headless_mode()
+RESULTS_FILE = "3-letter game results.json"
 
 # --- 2. Feedback function (green=2, yellow=1, gray=0) ---
+# Same on-disk cached pattern table as the solver scripts; patterns are base-3 codes.
+PATTERNS = cached_feedback_matrix(TARGET_CODES, TARGET_CODES)
+GUESS_INDEX = {w: i for i, w in enumerate(GUESSES)}
+TARGET_INDEX = {w: i for i, w in enumerate(TARGETS)}
+
 def score_feedback(guess, target):
-    fb = [0]*3
-    used = [False]*3
-    for i in range(3):
-        if guess[i] == target[i]:
-            fb[i] = 2
-            used[i] = True
-    for i in range(3):
-        if fb[i] == 0:
-            for j in range(3):
-                if not used[j] and guess[i] == target[j]:
-                    fb[i] = 1
-                    used[j] = True
-                    break
-    return tuple(fb)
+    return int(PATTERNS[GUESS_INDEX[guess], TARGET_INDEX[target]])
 
 # --- 3. Entropy calculation ---
 def expected_entropy(guess, candidates):
-    patterns = Counter(score_feedback(guess, target) for target in candidates)
-    total = len(candidates)
-    ent = 0.0
-    for count in patterns.values():
-        p = count / total
-        ent -= p * math.log2(p)
-    return ent
+    # candidates is an array of target indexes
+    return pattern_entropy(PATTERNS[GUESS_INDEX[guess], candidates])
+
+# --- 4. Hints ---
+HINT_WORDS = 5
+
+def print_hints(hint_engine, hard=None):
+    # In hard mode only guesses that may be played now are ranked
+    hints, remaining, complete = hint_engine.hints(None if hard is None else hard.legal)
+    print(f"Possible words remaining: {remaining}")
+    print(f"Best next guesses{'' if complete else ' (partial search)'}:")
+    for rank, hint in enumerate(hints, 1):
+        marker = '*' if hint['is_candidate'] else ' '
+        print(f"{rank:2d}. {GUESSES[hint['guess']]}{marker} {hint['entropy']:.3f} bits, "
+              f"~{hint['expected_remaining']:.1f} words left")
 
-# --- 4. Playable game loop ---
+# --- 5. Playable game loop ---
 def play_wordle():
     secret = random.choice(TARGETS)
-    candidates = TARGETS.copy()
+    # Tracks the candidate bitset incrementally and answers hint requests
+    hint_engine = HintEngine(PATTERNS, top_k=HINT_WORDS)
+    hard = HardMode(TARGET_CODES) if HARD_MODE else None
     entropy_trace = []
-    print("Welcome to 3-Letter Wordle!")
+    print(f"Welcome to 3-Letter Wordle{' (hard mode)' if hard is not None else ''}!")
+    print("Type '?' at any prompt for the best next guesses (* = could be the answer).")
     # Uncomment below to debug with a known word
     # print(f"[DEBUG] Secret word: {secret}")
     moves = 0
     while True:
         guess = input(f"\nEnter your guess #{moves+1} (3-letter word): ").lower().strip()
+        if guess in ('?', 'hint'):
+            print_hints(hint_engine, hard)
+            continue
         if len(guess) != 3 or guess not in GUESSES:
             print("Invalid guess. Please enter a valid 3-letter word from the allowed list.")
             continue
+        if hard is not None and not hard.legal[GUESS_INDEX[guess]]:
+            print(f"Not allowed in hard mode: {hard.violation(GUESS_INDEX[guess])}.")
+            continue
         fb = score_feedback(guess, secret)
         moves += 1
         # Print feedback in Wordle style
-        fb_str = ''.join(['🟩' if x==2 else '🟨' if x==1 else '⬜' for x in fb])
+        fb_str = ''.join(['🟩' if x==2 else '🟨' if x==1 else '⬜' for x in pattern_to_tuple(fb, 3)])
         print(f"Feedback: {fb_str}")
-        ent = expected_entropy(guess, candidates)
+        ent = expected_entropy(guess, hint_engine.candidates)
         entropy_trace.append(ent)
-        if fb == (2,2,2):
+        if fb == solved_pattern(3):
             print(f"Congratulations! You solved it in {moves} moves. The word was '{secret}'.")
             break
         # Filter candidates
-        candidates = [w for w in candidates if score_feedback(guess, w) == fb]
-        print(f"Possible words remaining: {len(candidates)}")
+        hint_engine.update(GUESS_INDEX[guess], fb)
+        if hard is not None:
+            hard.update(GUESS_INDEX[guess], fb)
+        print(f"Possible words remaining: {len(hint_engine.candidates)}")
+    if HEADLESS:
+        write_results(RESULTS_FILE, {"secret": secret, "moves": moves, "entropy_trace": entropy_trace})
+        print(f"Wrote {RESULTS_FILE}")
+        return
     # Plot entropy trace
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(7,4))
     plt.plot(range(1, len(entropy_trace)+1), entropy_trace, marker='o', color='blue')
     plt.title("Entropy After Each Move (3-Letter Wordle)")
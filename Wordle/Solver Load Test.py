@@ -0,0 +1,126 @@
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import numpy as np
+from wordle_engine import cached_feedback_matrix, decode_words, load_word_list, pattern_to_string
+
+# Load test for "Wordle Solver Service.py". Starts the service on a free
+# local port (or uses a running one with --port), then sends REQUESTS
+# /solve queries over CONCURRENCY keep-alive connections and reports latency
+# percentiles, split by whether the service answered from its state cache.
+# Histories replay 0..MAX_TURNS random guesses against a random secret, so
+# early states repeat (cache hits) and deeper ones are mostly new.
+
+# --- Config ---
+WORD_LENGTH = 5
+REQUESTS = 5000
+CONCURRENCY = 32
+MAX_TURNS = 2
+SEED = 0
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def make_histories(n, rng):
+    here = os.path.dirname(os.path.abspath(__file__))
+    codes, _ = load_word_list(os.path.join(here, "words", f"{WORD_LENGTH}-letter.txt"), WORD_LENGTH)
+    words = decode_words(codes)
+    patterns = cached_feedback_matrix(codes, codes)
+    histories = []
+    for _ in range(n):
+        secret = rng.randrange(len(words))
+        guesses = [rng.randrange(len(words)) for _ in range(rng.randint(0, MAX_TURNS))]
+        histories.append([[words[g], pattern_to_string(patterns[g, secret], WORD_LENGTH)] for g in guesses])
+    return histories
+
+async def request(reader, writer, method, target, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+async def client(port, queue, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while not queue.empty():
+            history = queue.get_nowait()
+            t0 = time.perf_counter()
+            status, reply = await request(reader, writer, "POST", "/solve", {"history": history})
+            elapsed = (time.perf_counter() - t0) * 1000
+            if status != 200:
+                raise RuntimeError(f"/solve returned {status}: {reply}")
+            latencies["cached" if reply["cached"] else "solved"].append(elapsed)
+    finally:
+        writer.close()
+
+async def wait_ready(port, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await request(reader, writer, "GET", "/health")
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"service on port {port} did not start")
+
+def percentile_line(name, values):
+    if not values:
+        return f"{name:>8}: no requests"
+    p50, p99 = np.percentile(values, [50, 99])
+    return (f"{name:>8}: {len(values):>6} requests, p50 {p50:7.2f} ms, p99 {p99:7.2f} ms, "
+            f"max {max(values):7.2f} ms, mean {statistics.mean(values):7.2f} ms")
+
+async def run(port):
+    await wait_ready(port)
+    queue = asyncio.Queue()
+    for history in make_histories(REQUESTS, random.Random(SEED)):
+        queue.put_nowait(history)
+    latencies = {"cached": [], "solved": []}
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(port, queue, latencies) for _ in range(CONCURRENCY)))
+    elapsed = time.perf_counter() - t0
+    print(f"{REQUESTS} requests over {CONCURRENCY} connections in {elapsed:.2f} s "
+          f"({REQUESTS / elapsed:,.0f} req/s)")
+    print(percentile_line("all", latencies["cached"] + latencies["solved"]))
+    print(percentile_line("cached", latencies["cached"]))
+    print(percentile_line("solved", latencies["solved"]))
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    _, stats = await request(reader, writer, "GET", "/stats")
+    writer.close()
+    print(f"Service: {stats['states_solved']} states solved, cache {stats['cache']}")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if "--port" in args:
+        asyncio.run(run(int(args[args.index("--port") + 1])))
+    else:
+        port = free_port()
+        here = os.path.dirname(os.path.abspath(__file__))
+        service = subprocess.Popen([sys.executable, os.path.join(here, "Wordle Solver Service.py"),
+                                    "--port", str(port), "--length", str(WORD_LENGTH)],
+                                   stdout=subprocess.DEVNULL)
+        try:
+            asyncio.run(run(port))
+        finally:
+            service.terminate()
+            service.wait()
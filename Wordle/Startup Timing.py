@@ -0,0 +1,55 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Measures how long each Wordle script takes to start (imports, word lists,
+# pattern tables: everything at module level, without the __main__ block) in
+# headless mode and with plotting, where matplotlib.pyplot gets imported.
+
+# --- Config ---
+SCRIPTS = [
+    "3-Letter Distribution.py",
+    "5-Letter Distribution.py",
+    "3-Letter Wordle Entropy + Multithreading + Animation.py",
+    "5-Letter Wordle Entropy + Multithreading + Animation.py",
+    "Play 3-Letter Wordle.py",
+]
+RUNS = 5
+
+PROBE = """
+import runpy, sys
+sys.path.insert(0, {dir!r})
+runpy.run_path({path!r}, run_name="startup_probe")
+if {plotting}:
+    import matplotlib.pyplot
+print("matplotlib" in sys.modules)
+"""
+
+def time_startup(path, plotting, workdir):
+    env = dict(os.environ, MPLBACKEND="Agg")
+    if plotting:
+        env.pop("WORDLE_HEADLESS", None)
+    else:
+        env["WORDLE_HEADLESS"] = "1"
+    code = PROBE.format(dir=os.path.dirname(path), path=path, plotting=plotting)
+    t0 = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=workdir,
+                         capture_output=True, text=True, check=True)
+    elapsed = time.perf_counter() - t0
+    return elapsed, out.stdout.strip().splitlines()[-1] == "True"
+
+if __name__ == "__main__":
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as workdir:
+        print(f"{'script':<58} {'headless s':>10} {'plotting s':>10}  matplotlib loaded (headless)")
+        for script in SCRIPTS:
+            path = os.path.join(here, script)
+            # One untimed run so the pattern-table disk cache is warm
+            time_startup(path, False, workdir)
+            headless = [time_startup(path, False, workdir) for _ in range(RUNS)]
+            plotting = [time_startup(path, True, workdir) for _ in range(RUNS)]
+            print(f"{script:<58} {statistics.median(t for t, _ in headless):>10.3f} "
+                  f"{statistics.median(t for t, _ in plotting):>10.3f}  {any(m for _, m in headless)}")
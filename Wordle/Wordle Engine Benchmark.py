@@ -0,0 +1,57 @@
+import random
+import time
+import tracemalloc
+import numpy as np
+from wordle_engine import (build_strategy_tree, feedback_matrix, pattern_dtype, solved_pattern,
+                           strategy_paths, summarize_paths)
+
+# --- Config ---
+WORD_LENGTHS = [3, 5, 7]
+DICTIONARY_SIZES = [500, 1000, 2000]
+SEED = 0
+
+# English letter frequencies (%), used to draw synthetic word lists of any
+# length so every configuration has the same letter statistics
+LETTER_FREQ = {
+    'e': 12.7, 't': 9.1, 'a': 8.2, 'o': 7.5, 'i': 7.0, 'n': 6.7, 's': 6.3, 'h': 6.1, 'r': 6.0,
+    'd': 4.3, 'l': 4.0, 'c': 2.8, 'u': 2.8, 'm': 2.4, 'w': 2.4, 'f': 2.2, 'g': 2.0, 'y': 2.0,
+    'p': 1.9, 'b': 1.5, 'v': 1.0, 'k': 0.8, 'j': 0.2, 'x': 0.2, 'q': 0.1, 'z': 0.1,
+}
+
+def synthetic_words(length, size, rng):
+    letters = list(LETTER_FREQ)
+    weights = list(LETTER_FREQ.values())
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choices(letters, weights, k=length)))
+    return sorted(words)
+
+# --- Benchmark one configuration ---
+def benchmark(length, size, rng):
+    words = synthetic_words(length, size, rng)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    patterns = feedback_matrix(words, words)
+    t1 = time.perf_counter()
+    tree = build_strategy_tree(patterns, np.arange(len(words)), solved_pattern(length))
+    t2 = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    _, avg_turns, _ = summarize_paths(strategy_paths(tree))
+    return {
+        "length": length, "words": size, "dtype": pattern_dtype(length).name,
+        "table_mb": patterns.nbytes / 1e6, "table_s": t1 - t0, "solve_s": t2 - t1,
+        "ms_per_game": (t2 - t0) / size * 1000, "peak_mb": peak / 1e6,
+        "kb_per_game": peak / size / 1e3, "avg_turns": avg_turns,
+    }
+
+if __name__ == "__main__":
+    rng = random.Random(SEED)
+    print(f"{'N':>2} {'words':>6} {'dtype':>6} {'table MB':>9} {'table s':>8} {'solve s':>8} "
+          f"{'ms/game':>8} {'peak MB':>8} {'KB/game':>8} {'turns':>6}")
+    for length in WORD_LENGTHS:
+        for size in DICTIONARY_SIZES:
+            r = benchmark(length, size, rng)
+            print(f"{r['length']:>2} {r['words']:>6} {r['dtype']:>6} {r['table_mb']:>9.2f} {r['table_s']:>8.3f} "
+                  f"{r['solve_s']:>8.3f} {r['ms_per_game']:>8.3f} {r['peak_mb']:>8.1f} {r['kb_per_game']:>8.1f} "
+                  f"{r['avg_turns']:>6.3f}")
@@ -0,0 +1,235 @@
+import asyncio
+import concurrent.futures
+import json
+import math
+import os
+import sys
+import time
+import numpy as np
+from wordle_engine import (LRUCache, PatternMaskIndex, cached_feedback_matrix, decode_words, expected_entropies,
+                           full_mask, load_word_list, mask_indices, word_list_summary)
+
+# Local entropy-solver service. Clients POST a guess/feedback history to
+# /solve and get back the best next guesses, the number of candidates left
+# and the expected entropy of each guess:
+#
+#   {"history": [["raise", "01200"], ["cloth", "gy..."]], "top": 5}
+#
+# Feedback is one character per letter: 2/g for green, 1/y for yellow and
+# 0/b/./- for gray. The pattern table stays loaded for the life of the
+# process; answers are cached by candidate-set fingerprint in an LRU. Scoring
+# runs on a thread pool (numpy releases the GIL), so the event loop keeps
+# serving cached states while a new one is being solved, and concurrent
+# requests for the same state share one computation.
+#
+#   python "Wordle Solver Service.py" [--port 8765 | --unix /tmp/wordle.sock] [--length 5]
+
+# --- 1. Config ---
+WORD_LENGTH = 5
+HOST = "127.0.0.1"
+PORT = 8765
+TOP_K = 5
+MAX_TOP_K = 50
+# Longest request body read; a guess history is a few hundred bytes
+MAX_BODY_BYTES = 1 << 16
+CACHE_SIZE = 100000
+SOLVER_THREADS = os.cpu_count()
+
+FEEDBACK_DIGITS = {'2': 2, 'g': 2, '1': 1, 'y': 1, '0': 0, 'b': 0, '.': 0, '-': 0}
+
+class BadRequest(ValueError):
+    pass
+
+# --- 2. Solver state shared by every connection ---
+class Solver:
+    def __init__(self, length):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words", f"{length}-letter.txt")
+        self.length = length
+        self.codes, self.info = load_word_list(path, length)
+        self.words = decode_words(self.codes)
+        self.index = {w: i for i, w in enumerate(self.words)}
+        # Load the table fully into memory rather than paging it from the mmap
+        self.patterns = np.array(cached_feedback_matrix(self.codes, self.codes))
+        self.n_targets = len(self.words)
+        self.pool = np.arange(len(self.words))
+        self.masks = PatternMaskIndex(self.patterns)
+        self.cache = LRUCache(CACHE_SIZE)
+        self.pending = {}
+        # States scored since startup (the warmed opening not included)
+        self.solved = 0
+        # Warm the opening, the most requested state
+        self.cache.put(full_mask(self.n_targets).tobytes(), self.rank(full_mask(self.n_targets)))
+
+    def parse_feedback(self, fb):
+        if len(fb) != self.length or any(c not in FEEDBACK_DIGITS for c in fb.lower()):
+            raise BadRequest(f"feedback {fb!r} must be {self.length} of 2/g, 1/y, 0/b/./-")
+        code = 0
+        for c in fb.lower():
+            code = code*3 + FEEDBACK_DIGITS[c]
+        return code
+
+    def state(self, history):
+        # Candidate bitmask after replaying the history
+        mask = full_mask(self.n_targets)
+        for item in history:
+            if not (isinstance(item, (list, tuple)) and len(item) == 2):
+                raise BadRequest("history entries must be [guess, feedback] pairs")
+            guess, fb = str(item[0]).lower(), str(item[1])
+            if guess not in self.index:
+                raise BadRequest(f"{guess!r} is not in the {self.length}-letter word list")
+            mask = self.masks.filter(mask, self.index[guess], self.parse_feedback(fb))
+        return mask
+
+    def rank(self, mask):
+        # Every guess scored against the state: the best MAX_TOP_K, ties broken
+        # toward words that could be the answer, with expected candidates left
+        candidates = mask_indices(mask, self.n_targets)
+        if len(candidates) == 0:
+            return {"candidates": 0, "guesses": []}
+        entropies = expected_entropies(self.patterns, candidates, self.pool)
+        is_candidate = np.zeros(len(self.pool), dtype=bool)
+        is_candidate[candidates] = True
+        k = min(MAX_TOP_K, len(self.pool))
+        best = np.argpartition(-(entropies + is_candidate * 1e-9), k - 1)[:k]
+        best = best[np.lexsort((best, ~is_candidate[best], -entropies[best]))]
+        guesses = []
+        for g in best.tolist():
+            counts = np.bincount(self.patterns[g, candidates])
+            guesses.append({"guess": self.words[g], "entropy": float(entropies[g]),
+                            "expected_remaining": float((counts.astype(np.float64)**2).sum() / len(candidates)),
+                            "is_candidate": bool(is_candidate[g])})
+        return {"candidates": len(candidates), "guesses": guesses}
+
+    async def solve(self, history, top, executor):
+        mask = self.state(history)
+        key = mask.tobytes()
+        result = self.cache.get(key)
+        cached = result is not None
+        if result is None:
+            # Concurrent requests for the same state wait on one computation
+            future = self.pending.get(key)
+            if future is None:
+                self.solved += 1
+                future = asyncio.get_running_loop().run_in_executor(executor, self.rank, mask)
+                self.pending[key] = future
+                try:
+                    result = await future
+                finally:
+                    del self.pending[key]
+                self.cache.put(key, result)
+            else:
+                result = await future
+        n = result["candidates"]
+        return {"candidates": n, "remaining_entropy": math.log2(n) if n else 0.0,
+                "solved": n == 1, "guesses": result["guesses"][:top], "cached": cached}
+
+    def stats(self):
+        return {"words": self.n_targets, "states_solved": self.solved, "cache": self.cache.stats(),
+                "feedback_masks": self.masks.rows.stats()}
+
+# --- 3. Minimal HTTP/1.1 with keep-alive ---
+async def read_request(reader):
+    # (method, target, headers, body), or None at end of stream. A request
+    # that cannot be framed raises BadRequest; the connection is closed after
+    # the 400, since the rest of the stream cannot be trusted.
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode('latin-1').split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+        raise BadRequest(f"malformed request line {line.decode('latin-1').strip()[:80]!r}")
+    method, target, _ = parts
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = headers.get('content-length', '0')
+    # isdigit alone accepts non-ASCII digits such as '²', which int() rejects
+    if not (length.isascii() and length.isdigit()):
+        raise BadRequest(f"invalid Content-Length {length!r}")
+    if int(length) > MAX_BODY_BYTES:
+        raise BadRequest(f"request body over {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(int(length))
+    return method, target, headers, body
+
+def write_response(writer, status, payload, keep_alive):
+    body = json.dumps(payload).encode()
+    reason = {200: "OK", 400: "Bad Request", 404: "Not Found"}[status]
+    writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                 .encode() + body)
+
+async def handle(solver, executor, reader, writer):
+    try:
+        while True:
+            try:
+                request = await read_request(reader)
+            except BadRequest as e:
+                write_response(writer, 400, {"error": str(e)}, False)
+                await writer.drain()
+                break
+            if request is None:
+                break
+            method, target, headers, body = request
+            keep_alive = headers.get('connection', '').lower() != 'close'
+            started = time.perf_counter()
+            try:
+                if method == "POST" and target == "/solve":
+                    query = json.loads(body or b"{}")
+                    if not isinstance(query, dict):
+                        raise BadRequest("request body must be a JSON object")
+                    top = query.get("top", TOP_K)
+                    # JSON numbers may be floats (2.7, 1e400); bool is an int subclass
+                    if not isinstance(top, int) or isinstance(top, bool):
+                        raise BadRequest("top must be an integer")
+                    if not 1 <= top <= MAX_TOP_K:
+                        raise BadRequest(f"top must be between 1 and {MAX_TOP_K}")
+                    status, payload = 200, await solver.solve(query.get("history", []), top, executor)
+                    payload["ms"] = (time.perf_counter() - started) * 1000
+                elif method == "GET" and target == "/health":
+                    status, payload = 200, {"ok": True, "word_length": solver.length}
+                elif method == "GET" and target == "/stats":
+                    status, payload = 200, solver.stats()
+                else:
+                    status, payload = 404, {"error": f"no route for {method} {target}"}
+            except (BadRequest, ValueError, TypeError) as e:
+                status, payload = 400, {"error": str(e)}
+            write_response(writer, status, payload, keep_alive)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(solver, port=None, unix_path=None):
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=SOLVER_THREADS)
+    callback = lambda reader, writer: handle(solver, executor, reader, writer)
+    if unix_path:
+        server = await asyncio.start_unix_server(callback, path=unix_path)
+        where = unix_path
+    else:
+        server = await asyncio.start_server(callback, HOST, port)
+        where = f"http://{HOST}:{port}"
+    print(f"Serving {solver.n_targets} {solver.length}-letter words on {where}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    length = int(args[args.index("--length") + 1]) if "--length" in args else WORD_LENGTH
+    port = int(args[args.index("--port") + 1]) if "--port" in args else PORT
+    unix_path = args[args.index("--unix") + 1] if "--unix" in args else None
+    t0 = time.perf_counter()
+    solver = Solver(length)
+    print(word_list_summary(solver.info))
+    print(f"Solver ready in {time.perf_counter() - t0:.2f} s "
+          f"(pattern table {solver.patterns.nbytes / 1e6:.1f} MB)", flush=True)
+    try:
+        asyncio.run(serve(solver, port, unix_path))
+    except KeyboardInterrupt:
+        pass
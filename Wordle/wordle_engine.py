@@ -0,0 +1,843 @@
+import concurrent.futures
+import hashlib
+import heapq
+import json
+import math
+import os
+import sys
+import time
+from collections import OrderedDict
+from multiprocessing import shared_memory
+import numpy as np
+
+# Shared feedback/entropy engine for the Wordle scripts, for any word length.
+# Feedback patterns are base-3 encoded (green=2, yellow=1, gray=0) with the
+# first letter as the most significant digit, so '22222' -> 242 and the
+# solved pattern is always 3**N - 1. Tables use the smallest unsigned type
+# that holds 3**N codes: uint8 up to 5 letters, uint16 up to 10.
+
+# --- 1. Word lists and encoding ---
+# Word lists live in text files, one word per line, and are held as
+# (n_words, N) uint8 arrays of lowercase ASCII codes. The kernels below take
+# those arrays as they are; Python string lists are encoded on the way in.
+DEFAULT_BLOCK_BYTES = 1 << 22
+
+def encode_words(words):
+    # (n_words, N) uint8 array of ASCII letter codes; arrays pass through
+    if isinstance(words, np.ndarray):
+        return words
+    buf = ''.join(words).encode('ascii')
+    return np.frombuffer(buf, dtype=np.uint8).reshape(len(words), -1)
+
+def decode_words(rows):
+    return rows.view(f"S{rows.shape[1]}").ravel().astype(str).tolist()
+
+def parse_word_block(buf, length):
+    # (rows, skipped) for the complete lines in a uint8 buffer. Lines must be
+    # exactly `length` ASCII letters (either case, optional \r); blank lines
+    # are ignored and every other line is counted as skipped.
+    ends = np.flatnonzero(buf == 10)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    stops = ends.copy()
+    has_cr = (stops > starts) & (buf[np.maximum(stops - 1, 0)] == 13)
+    stops[has_cr] -= 1
+    sized = (stops - starts) == length
+    blank = stops == starts
+    rows = buf[starts[sized, None] + np.arange(length)] | 0x20
+    letters = ((rows >= 97) & (rows <= 122)).all(axis=1)
+    skipped = int(len(starts) - blank.sum() - letters.sum())
+    return rows[letters], skipped
+
+def read_word_rows(path, length, block_bytes=DEFAULT_BLOCK_BYTES):
+    # Yields (rows, skipped) per block of the file, without building a
+    # Python string per word
+    carry = b""
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(block_bytes)
+            if not block:
+                break
+            data = carry + block
+            cut = data.rfind(b"\n") + 1
+            carry = data[cut:]
+            if cut:
+                yield parse_word_block(np.frombuffer(data, dtype=np.uint8, count=cut), length)
+    if carry:
+        yield parse_word_block(np.frombuffer(carry + b"\n", dtype=np.uint8), length)
+
+def load_word_list(path, length):
+    # (rows, info): the valid words of the file in first-seen order with
+    # duplicates dropped, and what loading them cost
+    t0 = time.perf_counter()
+    blocks, skipped = [], 0
+    for rows, bad in read_word_rows(path, length):
+        blocks.append(rows)
+        skipped += bad
+    rows = np.concatenate(blocks) if blocks else np.empty((0, length), dtype=np.uint8)
+    if len(rows) == 0:
+        raise ValueError(f"{path} has no valid {length}-letter words")
+    _, first = np.unique(rows.view(f"S{length}").ravel(), return_index=True)
+    words = np.ascontiguousarray(rows[np.sort(first)])
+    info = {"path": path, "words": len(words), "duplicates": len(rows) - len(words), "skipped": skipped,
+            "seconds": time.perf_counter() - t0, "bytes": words.nbytes,
+            # What the same list costs as Python strings (object + list slot)
+            "str_bytes": len(words) * (sys.getsizeof('a' * length) + 8)}
+    return words, info
+
+def word_list_summary(info):
+    return (f"Loaded {info['words']} words from {os.path.basename(info['path'])} in "
+            f"{info['seconds'] * 1000:.1f} ms ({info['bytes'] / 1024:.1f} KB as uint8 vs "
+            f"~{info['str_bytes'] / 1024:.0f} KB as str); dropped {info['duplicates']} duplicates, "
+            f"skipped {info['skipped']} invalid lines")
+
+def solved_pattern(n):
+    return 3**n - 1
+
+def pattern_dtype(n):
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if 3**n <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+    raise ValueError(f"{n}-letter patterns do not fit in uint32")
+
+def pattern_to_tuple(code, n):
+    fb = [0]*n
+    for i in range(n - 1, -1, -1):
+        code, fb[i] = divmod(int(code), 3)
+    return tuple(fb)
+
+def pattern_to_string(code, n):
+    return ''.join(map(str, pattern_to_tuple(code, n)))
+
+# --- 2. Feedback matrix ---
+def _feedback_block(g, t):
+    # g: (G, N) guess codes, t: (T, N) target codes -> (G, T) pattern codes
+    n = g.shape[1]
+    green = g[:, None, :] == t[None, :, :]
+    dtype = pattern_dtype(n)
+    codes = np.zeros((g.shape[0], t.shape[0]), dtype=dtype)
+    for i in range(n):
+        letter = g[:, i][:, None]
+        # Target letters not already matched by a green are available for yellows
+        avail = np.zeros(codes.shape, dtype=np.uint8)
+        for j in range(n):
+            avail += (t[None, :, j] == letter) & ~green[:, :, j]
+        # Earlier non-green copies of the same guess letter use them up first
+        earlier = np.zeros(codes.shape, dtype=np.uint8)
+        for k in range(i):
+            earlier += (g[:, k] == g[:, i])[:, None] & ~green[:, :, k]
+        yellow = ~green[:, :, i] & (earlier < avail)
+        digit = 2*green[:, :, i] + yellow
+        codes = codes*3 + digit.astype(dtype)
+    return codes
+
+# Working memory for blocked kernels; blocks of guesses are sized to fit it.
+# Kernels take memory_cap_mb=None to mean this value, read at call time.
+DEFAULT_MEMORY_CAP_MB = 256
+
+def feedback_matrix(guesses, targets, memory_cap_mb=None, out=None):
+    # Full guess x target pattern table, computed in blocks of guesses.
+    # Pass a memmap as out to write a table larger than RAM straight to disk.
+    memory_cap_mb = memory_cap_mb or DEFAULT_MEMORY_CAP_MB
+    g = encode_words(guesses)
+    t = encode_words(targets)
+    dtype = pattern_dtype(g.shape[1])
+    if out is None:
+        out = np.empty((len(guesses), len(targets)), dtype=dtype)
+    # ~N bytes of green flags plus a handful of code-sized temporaries per pair
+    block = max(1, int(memory_cap_mb * 2**20) // (len(targets) * (g.shape[1] + 8*dtype.itemsize)))
+    for start in range(0, len(guesses), block):
+        out[start:start+block] = _feedback_block(g[start:start+block], t)
+    return out
+
+# On-disk cache: one .npy file per (format version, word length, word lists),
+# loaded with mmap so repeat runs skip the computation. The key is a hash of
+# both lists, so editing either one picks a new file. Writers go through a
+# per-process temp file and an atomic os.replace, so concurrent starts never
+# see a partial table.
+PATTERN_CACHE_VERSION = 1
+PATTERN_CACHE_DIR = os.environ.get(
+    'WORDLE_PATTERN_CACHE', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.pattern_cache'))
+
+def word_list_key(guesses, targets):
+    h = hashlib.sha256()
+    h.update(f"v{PATTERN_CACHE_VERSION}|{len(guesses[0])}|".encode())
+    h.update(b'\n'.join(encode_words(guesses).view(f"S{len(guesses[0])}").ravel()))
+    h.update(b'|')
+    h.update(b'\n'.join(encode_words(targets).view(f"S{len(targets[0])}").ravel()))
+    return h.hexdigest()[:20]
+
+def pattern_cache_path(guesses, targets, cache_dir=None):
+    name = f"patterns-v{PATTERN_CACHE_VERSION}-{len(guesses[0])}-{word_list_key(guesses, targets)}.npy"
+    return os.path.join(cache_dir or PATTERN_CACHE_DIR, name)
+
+def cached_feedback_matrix(guesses, targets, cache_dir=None, memory_cap_mb=None):
+    path = pattern_cache_path(guesses, targets, cache_dir)
+    shape = (len(guesses), len(targets))
+    try:
+        patterns = np.load(path, mmap_mode='r')
+        if patterns.shape == shape:
+            return patterns
+    except (OSError, ValueError):
+        pass
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        out = np.lib.format.open_memmap(tmp, mode='w+', dtype=pattern_dtype(len(guesses[0])), shape=shape)
+        feedback_matrix(guesses, targets, memory_cap_mb, out=out)
+        out.flush()
+        del out
+        os.replace(tmp, path)
+    except OSError:
+        # Read-only or full disk: fall back to an in-memory table
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return feedback_matrix(guesses, targets, memory_cap_mb)
+    return np.load(path, mmap_mode='r')
+
+# --- 3. Entropy as a table lookup ---
+def pattern_entropy(row):
+    # Entropy (bits) of the pattern distribution in one row of the table
+    counts = np.bincount(row)
+    counts = counts[counts > 0]
+    total = counts.sum()
+    p = counts / total
+    return float(-(p * np.log2(p)).sum()) + 0.0
+
+# --- 4. Batched entropy of every guess ---
+_NLOGN = np.zeros(1)
+
+def nlogn_table(n):
+    # n*log2(n) for 0..n, grown on demand and shared by all calls
+    global _NLOGN
+    if len(_NLOGN) <= n:
+        k = np.arange(n + 1, dtype=np.float64)
+        k[0] = 1.0
+        _NLOGN = k * np.log2(k)
+    return _NLOGN
+
+def expected_entropies(patterns, candidates, guesses=None, n_patterns=None, memory_cap_mb=None):
+    # Expected entropy of every guess row against the candidate targets.
+    # Each row's pattern counts come from one bincount over row-offset codes.
+    # Guesses are scored in blocks sized to memory_cap_mb, so a memmapped table
+    # with a large guess pool is only paged in one block at a time.
+    # Without n_patterns the bin count is taken from each block's largest code,
+    # which works for any word length and shrinks as the candidates thin out.
+    candidates = np.asarray(candidates)
+    if guesses is None:
+        guesses = np.arange(patterns.shape[0])
+    memory_cap_mb = memory_cap_mb or DEFAULT_MEMORY_CAP_MB
+    max_bins = n_patterns or min(np.iinfo(patterns.dtype).max + 1, 3**10)
+    total = len(candidates)
+    # table gather + int64 offset codes per pair, int64 counts + float gather per bin
+    per_row = total * (patterns.dtype.itemsize + 8) + max_bins * 16
+    block = max(1, int(memory_cap_mb * 2**20) // per_row)
+    nlogn = nlogn_table(total)
+    out = np.empty(len(guesses))
+    for start in range(0, len(guesses), block):
+        rows = guesses[start:start+block]
+        codes = patterns[np.ix_(rows, candidates)].astype(np.int64)
+        bins = n_patterns or int(codes.max()) + 1
+        codes += (np.arange(len(rows)) * bins)[:, None]
+        counts = np.bincount(codes.ravel(), minlength=len(rows)*bins)
+        counts = counts.reshape(len(rows), bins)
+        out[start:start+block] = math.log2(total) - nlogn[counts].sum(axis=1) / total
+    return out
+
+def best_guess(patterns, candidates, guesses=None, n_patterns=None, memory_cap_mb=None):
+    # (position in guesses, entropy) of the highest-entropy guess
+    entropies = expected_entropies(patterns, candidates, guesses, n_patterns, memory_cap_mb)
+    best = int(np.argmax(entropies))
+    return best, float(entropies[best])
+
+def choose_guess(patterns, candidates, guess_pool=None, n_patterns=None, memory_cap_mb=None):
+    # (guess row, entropy) for a state. With no pool the guess is one of the
+    # remaining candidates; otherwise any row in guess_pool may be played.
+    # Guess lists put the targets first, so target i is also guess row i.
+    candidates = np.asarray(candidates)
+    if guess_pool is None or len(candidates) == 1:
+        best, ent = best_guess(patterns, candidates, candidates, n_patterns, memory_cap_mb)
+        return int(candidates[best]), ent
+    entropies = expected_entropies(patterns, candidates, guess_pool, n_patterns, memory_cap_mb)
+    # Break ties toward guesses that could be the answer
+    bonus = np.isin(guess_pool, candidates) * 1e-9
+    best = int(np.argmax(entropies + bonus))
+    return int(guess_pool[best]), float(entropies[best])
+
+# --- 4b. Opening rankings ---
+def top_openers(patterns, candidates, k=10, guesses=None, n_patterns=None, memory_cap_mb=None):
+    # [(entropy, guess row)] best first: one batched pass, then a k-sized heap
+    guesses = np.arange(patterns.shape[0]) if guesses is None else np.asarray(guesses)
+    entropies = expected_entropies(patterns, candidates, guesses, n_patterns, memory_cap_mb)
+    return heapq.nlargest(k, zip(entropies.tolist(), guesses.tolist()))
+
+def joint_entropies(patterns, candidates, first, seconds, n_patterns=None):
+    # Entropy of the joint feedback of (first, second) for each second guess.
+    # Joint codes are sorted per row (radix sort when they fit in 16 bits) and
+    # the run lengths give the partition sizes, so sparse joint code spaces
+    # (243**2 for five letters) never need a dense bincount.
+    candidates = np.asarray(candidates)
+    n = len(candidates)
+    k = n_patterns or (256 if patterns.dtype == np.uint8 else 3**10)
+    dtype = np.uint16 if k*k <= 2**16 else np.uint32
+    codes = patterns[first, candidates].astype(dtype)[None, :] * dtype(k)
+    codes = codes + patterns[np.ix_(seconds, candidates)]
+    flat = np.sort(codes, axis=1, kind='stable').ravel()
+    new = np.empty(flat.shape, dtype=bool)
+    new[0] = True
+    np.not_equal(flat[1:], flat[:-1], out=new[1:])
+    new[::n] = True
+    starts = np.flatnonzero(new)
+    lengths = np.diff(np.append(starts, flat.size))
+    sums = np.bincount(starts // n, weights=nlogn_table(n)[lengths], minlength=len(seconds))
+    return math.log2(n) - sums / n
+
+def top_opening_pairs(patterns, candidates, k=10, guesses=None, n_patterns=None, block=256, memory_cap_mb=None):
+    # [(joint entropy, first, second)] best first, plus the number of pairs
+    # actually scored. H(a, b) <= H(a) + H(b), so with guesses in decreasing
+    # entropy order every pair whose bound cannot beat the current k-th best
+    # is skipped without being scored.
+    candidates = np.asarray(candidates)
+    guesses = np.arange(patterns.shape[0]) if guesses is None else np.asarray(guesses)
+    entropies = expected_entropies(patterns, candidates, guesses, n_patterns, memory_cap_mb)
+    order = np.argsort(-entropies, kind='stable')
+    ranked = entropies[order]
+    heap = []
+    threshold = -math.inf
+    scored = 0
+    for a in range(len(order) - 1):
+        if ranked[a] + ranked[a+1] <= threshold:
+            break
+        start = a + 1
+        while start < len(order):
+            # Partners are in decreasing entropy, so the viable ones are a prefix
+            stop = a + 1 + int(np.searchsorted(-ranked[a+1:], ranked[a] - threshold, side='left'))
+            stop = min(stop, start + block)
+            if stop <= start:
+                break
+            seconds = guesses[order[start:stop]]
+            joint = joint_entropies(patterns, candidates, guesses[order[a]], seconds, n_patterns)
+            scored += len(seconds)
+            for ent, second in zip(joint.tolist(), seconds.tolist()):
+                item = (ent, int(guesses[order[a]]), second)
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+            if len(heap) == k:
+                threshold = heap[0][0]
+            start = stop
+    return sorted(heap, reverse=True), scored
+
+# --- 5. Candidate-state fingerprints and a bounded LRU cache ---
+def state_key(candidates, n_targets):
+    # Bitset over target indexes packed into bytes (296 bytes for 2309 targets).
+    # bytes caches its own hash, so repeated lookups do not rehash.
+    return indices_to_mask(candidates, n_targets).tobytes()
+
+class LRUCache:
+    def __init__(self, maxsize=100000):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self.data)
+
+    def stats(self):
+        return {"size": len(self.data), "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+# --- 5b. Bitset candidate sets ---
+# A candidate set is a packed little-endian uint64 bitset over target indexes,
+# so filtering by one feedback is a single AND of ceil(T/64) words.
+def pack_mask(bool_mask):
+    # Pack a (..., T) boolean array into (..., ceil(T/64)) uint64 words
+    bits = np.packbits(bool_mask, axis=-1, bitorder='little')
+    pad = -bits.shape[-1] % 8
+    if pad:
+        bits = np.concatenate([bits, np.zeros(bits.shape[:-1] + (pad,), dtype=np.uint8)], axis=-1)
+    return np.ascontiguousarray(bits).view('<u8')
+
+def full_mask(n_targets):
+    return pack_mask(np.ones(n_targets, dtype=bool))
+
+def indices_to_mask(candidates, n_targets):
+    bool_mask = np.zeros(n_targets, dtype=bool)
+    bool_mask[candidates] = True
+    return pack_mask(bool_mask)
+
+def mask_indices(mask, n_targets):
+    bits = np.unpackbits(mask.view(np.uint8), bitorder='little', count=n_targets)
+    return np.flatnonzero(bits)
+
+class PatternMaskIndex:
+    # (guess, feedback) -> target bitmask. Each guess row is indexed the first
+    # time it is played; rows are kept in a bounded LRU since a full index for
+    # every guess and pattern would be T*G*3^N bits.
+    def __init__(self, patterns, maxsize=4096):
+        self.patterns = patterns
+        self.n_targets = patterns.shape[1]
+        self.rows = LRUCache(maxsize=maxsize)
+
+    def row(self, guess_idx):
+        row = self.rows.get(guess_idx)
+        if row is None:
+            codes = np.asarray(self.patterns[guess_idx])
+            present = np.unique(codes)
+            masks = pack_mask(codes[None, :] == present[:, None])
+            row = dict(zip(present.tolist(), masks))
+            self.rows.put(guess_idx, row)
+        return row
+
+    def mask(self, guess_idx, fb):
+        row = self.row(guess_idx)
+        if fb in row:
+            return row[fb]
+        return np.zeros_like(next(iter(row.values())))
+
+    def filter(self, mask, guess_idx, fb):
+        return mask & self.mask(guess_idx, fb)
+
+# --- 5c. Hint engine for interactive play ---
+class HintEngine:
+    # Top-k next guesses for the current state within a latency budget.
+    # The state is a bitset updated incrementally after each feedback. Hints
+    # for the opening and for every reply to the best opener are computed up
+    # front, and all fully scored states are kept in an LRU. Other states
+    # score guesses in blocks, best openers first, until the budget would be
+    # exceeded, returning the best guesses found so far. In hard mode only
+    # the legal guesses are ranked, and the legal bitset joins the cache key.
+    def __init__(self, patterns, guess_pool=None, top_k=5, budget_ms=5.0,
+                 block_pairs=50000, cache_size=10000, warm=True):
+        self.patterns = patterns
+        self.n_targets = patterns.shape[1]
+        self.top_k = top_k
+        self.budget = budget_ms / 1000
+        self.block_pairs = block_pairs
+        self.masks = PatternMaskIndex(patterns)
+        self.cache = LRUCache(cache_size)
+        pool = np.arange(patterns.shape[0]) if guess_pool is None else np.asarray(guess_pool)
+        self.reset()
+        # Scan order for partial searches; scoring the opening also warms the cache
+        opening = expected_entropies(patterns, self.candidates, pool)
+        self.order = pool[np.argsort(-opening, kind='stable')]
+        self.cache.put(self.mask.tobytes(), self._top(self.order, np.sort(opening)[::-1], True))
+        if warm:
+            self.warm(int(self.order[0]))
+
+    def warm(self, guess_idx):
+        # Cache complete hints for every state one reply after guess_idx
+        start_mask = self.mask
+        for fb in self.masks.row(guess_idx):
+            self.mask = start_mask & self.masks.mask(guess_idx, fb)
+            self.candidates = mask_indices(self.mask, self.n_targets)
+            self.cache.put(self.mask.tobytes(), self._score(math.inf))
+        self.mask = start_mask
+        self.candidates = mask_indices(self.mask, self.n_targets)
+
+    def reset(self):
+        self.mask = full_mask(self.n_targets)
+        self.candidates = np.arange(self.n_targets)
+
+    def update(self, guess_idx, fb):
+        self.mask = self.masks.filter(self.mask, guess_idx, fb)
+        self.candidates = mask_indices(self.mask, self.n_targets)
+
+    def _top(self, guesses, entropies, complete):
+        # Best top_k of the scored guesses, with expected remaining candidates
+        k = min(self.top_k, len(guesses))
+        best = np.argpartition(-entropies, k - 1)[:k]
+        best = best[np.lexsort((~np.isin(guesses[best], self.candidates), -entropies[best]))]
+        total = len(self.candidates)
+        hints = []
+        for i in best:
+            counts = np.bincount(self.patterns[guesses[i], self.candidates])
+            hints.append({"guess": int(guesses[i]), "entropy": float(entropies[i]),
+                          "expected_remaining": float((counts.astype(np.float64)**2).sum() / total),
+                          "is_candidate": bool(guesses[i] in self.candidates)})
+        return hints, complete
+
+    def _score(self, budget, legal=None):
+        # legal: bool array over guess rows (HardMode.legal), or None for any guess
+        order = self.order if legal is None else self.order[legal[self.order]]
+        if len(self.candidates) <= 2:
+            # Guess a remaining word; nothing scores better
+            guesses = self.candidates
+            return self._top(guesses, expected_entropies(self.patterns, self.candidates, guesses), True)
+        block = max(1, self.block_pairs // len(self.candidates))
+        started = time.perf_counter()
+        scored, entropies = [], []
+        for start in range(0, len(order), block):
+            rows = order[start:start+block]
+            scored.append(rows)
+            entropies.append(expected_entropies(self.patterns, self.candidates, rows))
+            # Stop early if one more block of the same size would overrun
+            elapsed = time.perf_counter() - started
+            if elapsed * (len(scored) + 1) / len(scored) > budget:
+                break
+        complete = start + block >= len(order)
+        return self._top(np.concatenate(scored), np.concatenate(entropies), complete)
+
+    def hints(self, legal=None):
+        # (hints, candidate count, whether every guess was scored); pass
+        # HardMode.legal to rank only the guesses hard mode allows
+        if legal is not None and legal.all():
+            legal = None
+        key = self.mask.tobytes()
+        if legal is not None:
+            key += np.packbits(legal).tobytes()
+        result = self.cache.get(key)
+        if result is None:
+            result = self._score(self.budget, legal)
+            if result[1]:
+                self.cache.put(key, result)
+        return result[0], len(self.candidates), result[1]
+
+# --- 5d. Optional solver profiling ---
+# A SolverProfile is passed down the solver loop only when profiling is on;
+# with profile=None the loop does one `is None` check per state and nothing
+# else. Worker profiles are plain dicts merged into the parent's report.
+def profiling_mode():
+    # --profile or WORDLE_PROFILE=1
+    return '--profile' in sys.argv or os.environ.get('WORDLE_PROFILE') == '1'
+
+PROFILE_FIELDS = ("states", "score_s", "filter_s", "patterns", "candidates", "max_candidates")
+
+class SolverProfile:
+    def __init__(self):
+        # turn -> counters: states solved at that turn, seconds choosing the
+        # guess and filtering candidates, pattern lookups scored, candidate sizes
+        self.turns = {}
+        # cache name -> {"hits", "misses"}
+        self.caches = {}
+
+    def record(self, turn, score_s, filter_s, patterns, candidates):
+        entry = self.turns.setdefault(turn, dict.fromkeys(PROFILE_FIELDS, 0))
+        entry["states"] += 1
+        entry["score_s"] += score_s
+        entry["filter_s"] += filter_s
+        entry["patterns"] += patterns
+        entry["candidates"] += candidates
+        entry["max_candidates"] = max(entry["max_candidates"], candidates)
+
+    def record_cache(self, name, stats):
+        entry = self.caches.setdefault(name, {"hits": 0, "misses": 0})
+        entry["hits"] += stats["hits"]
+        entry["misses"] += stats["misses"]
+
+    def to_dict(self):
+        return {"turns": self.turns, "caches": self.caches}
+
+    def merge(self, data):
+        # data: another profile's to_dict(), e.g. from a pool worker
+        for turn, other in data["turns"].items():
+            entry = self.turns.setdefault(turn, dict.fromkeys(PROFILE_FIELDS, 0))
+            for field in PROFILE_FIELDS:
+                if field == "max_candidates":
+                    entry[field] = max(entry[field], other[field])
+                else:
+                    entry[field] += other[field]
+        for name, stats in data["caches"].items():
+            self.record_cache(name, stats)
+
+    def report(self):
+        lines = [f"{'turn':>4} {'states':>7} {'score s':>8} {'filter s':>8} {'patterns':>12} "
+                 f"{'avg cands':>9} {'max cands':>9}"]
+        for turn, e in sorted(self.turns.items()):
+            lines.append(f"{turn:>4} {e['states']:>7} {e['score_s']:>8.3f} {e['filter_s']:>8.3f} "
+                         f"{e['patterns']:>12,} {e['candidates'] / e['states']:>9.1f} {e['max_candidates']:>9}")
+        for name, c in sorted(self.caches.items()):
+            total = c["hits"] + c["misses"]
+            lines.append(f"cache {name}: {c['hits']:,} hits / {total:,} lookups "
+                         f"({c['hits'] / total if total else 0:.1%})")
+        return "\n".join(lines)
+
+# --- 5e. Hard mode ---
+# Wordle's hard mode: a green letter must be played in the same spot again,
+# and every revealed letter (green or yellow) must be reused, as many times
+# as one feedback revealed it. Each guess word is stored once as per-position
+# letter bits and a 26-letter count vector; the rules are a per-position
+# allowed-letter bitmask and a minimum count vector. Rules only ever tighten,
+# so after each feedback the legal set is narrowed by re-checking just the
+# positions and letters that changed: a few vector ops over the whole pool.
+class HardMode:
+    def __init__(self, guess_codes):
+        self.letters = encode_words(guess_codes).astype(np.int64) - 97
+        n_guesses, self.n = self.letters.shape
+        self.letter_bits = np.left_shift(np.uint32(1), self.letters.astype(np.uint32))
+        offsets = (np.arange(n_guesses) * 26)[:, None]
+        self.counts = np.bincount((self.letters + offsets).ravel(),
+                                  minlength=n_guesses * 26).reshape(n_guesses, 26).astype(np.uint8)
+        self.reset()
+
+    def reset(self):
+        self.allowed = np.full(self.n, (1 << 26) - 1, dtype=np.uint32)
+        self.min_counts = np.zeros(26, dtype=np.uint8)
+        self.legal = np.ones(len(self.letters), dtype=bool)
+
+    def update(self, guess_idx, fb):
+        letters = self.letters[guess_idx]
+        revealed = np.zeros(26, dtype=np.uint8)
+        fixed = []
+        for i, digit in enumerate(pattern_to_tuple(fb, self.n)):
+            if digit:
+                revealed[letters[i]] += 1
+            if digit == 2 and self.allowed[i] != 1 << letters[i]:
+                self.allowed[i] = 1 << letters[i]
+                fixed.append(i)
+        raised = np.flatnonzero(revealed > self.min_counts)
+        np.maximum(self.min_counts, revealed, out=self.min_counts)
+        if fixed:
+            self.legal &= ((self.letter_bits[:, fixed] & self.allowed[fixed]) != 0).all(axis=1)
+        if len(raised):
+            self.legal &= (self.counts[:, raised] >= self.min_counts[raised]).all(axis=1)
+
+    def legal_rows(self, pool=None):
+        # Guess rows (of pool, if given) that may be played now
+        if pool is None:
+            return np.flatnonzero(self.legal)
+        pool = np.asarray(pool)
+        return pool[self.legal[pool]]
+
+    def violation(self, guess_idx):
+        # Why a guess is not allowed, or None if it is
+        for i in range(self.n):
+            if not self.letter_bits[guess_idx, i] & self.allowed[i]:
+                letter = chr(97 + int(self.allowed[i]).bit_length() - 1)
+                return f"letter {i + 1} must be '{letter}'"
+        for c in np.flatnonzero(self.counts[guess_idx] < self.min_counts).tolist():
+            times = int(self.min_counts[c])
+            return f"guess must contain '{chr(97 + c)}'" + (f" {times} times" if times > 1 else "")
+        return None
+
+# --- 6. Greedy-entropy strategy tree ---
+# Nodes are dicts: {"guess", "entropy", "size", "solved", "children"}.
+# "solved" holds the target indexes that the guess itself solves (normally just
+# the guess; more than one only when the list contains duplicate words) and
+# "children" maps each other feedback code to the subtree for that partition.
+def partition(patterns, guess_idx, candidates):
+    # {feedback code: target indexes} for one guess over the candidates
+    candidates = np.asarray(candidates)
+    fbs = patterns[guess_idx, candidates]
+    order = np.argsort(fbs, kind='stable')
+    codes, starts = np.unique(fbs[order], return_index=True)
+    groups = np.split(candidates[order], starts[1:])
+    return dict(zip(codes.tolist(), groups))
+
+def build_strategy_tree(patterns, candidates, solved, n_patterns=None, guess_pool=None, profile=None, turn=1,
+                        memory_cap_mb=None):
+    # Expand every distinct candidate partition exactly once, choosing the
+    # max-entropy guess like simulate_game does
+    candidates = np.asarray(candidates)
+    if profile is not None:
+        t0 = time.perf_counter()
+    guess_idx, ent = choose_guess(patterns, candidates, guess_pool, n_patterns, memory_cap_mb)
+    if profile is not None:
+        t1 = time.perf_counter()
+    groups = partition(patterns, guess_idx, candidates)
+    if profile is not None:
+        pool = len(candidates) if guess_pool is None else len(guess_pool)
+        profile.record(turn, t1 - t0, time.perf_counter() - t1, pool * len(candidates), len(candidates))
+    node = {"guess": guess_idx, "entropy": ent, "size": len(candidates),
+            "solved": [], "children": {}}
+    for code, group in groups.items():
+        if code == solved:
+            node["solved"] = group.tolist()
+        else:
+            node["children"][code] = build_strategy_tree(patterns, group, solved, n_patterns, guess_pool,
+                                                         profile, turn + 1, memory_cap_mb)
+    return node
+
+def tree_size(node):
+    return 1 + sum(tree_size(child) for child in node["children"].values())
+
+def strategy_paths(tree):
+    # {target index: (guess path, entropy trace)} for every target in the tree
+    paths = {}
+    stack = [(tree, [], [])]
+    while stack:
+        node, guesses, entropies = stack.pop()
+        guesses = guesses + [node["guess"]]
+        entropies = entropies + [node["entropy"]]
+        for target in node["solved"]:
+            paths[target] = (guesses, entropies)
+        for child in node["children"].values():
+            stack.append((child, guesses, entropies))
+    return paths
+
+def summarize_paths(paths):
+    # Turn-count histogram, average turns and per-turn average entropy,
+    # reduced over the flattened traces (see wordle_results for the stored form)
+    traces = [entropies for _, entropies in paths.values()]
+    lengths = np.array([len(trace) for trace in traces])
+    values = np.concatenate(traces)
+    turn = np.arange(len(values)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    avg_entropy_by_turn = (np.bincount(turn, weights=values) / np.bincount(turn)).tolist()
+    turn_hist = {int(t): int(c) for t, c in enumerate(np.bincount(lengths)) if c}
+    return turn_hist, float(lengths.mean()), avg_entropy_by_turn
+
+# --- 7. Shared pattern table for process pools ---
+# A table memmapped from the pattern cache is reopened by path in each
+# worker, so it stays on disk and in the page cache, never copied into RAM.
+# An in-memory table (e.g. the cache directory was read-only) is copied once
+# into a shared-memory block instead. Either way each worker maps it read-only
+# in its initializer instead of building its own copy.
+_WORKER = {}
+
+def _status_mb(field):
+    # A VmRSS/VmHWM line of /proc/self/status in MB, or None without /proc
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+def peak_rss_mb():
+    peak = _status_mb('VmHWM')
+    if peak is not None:
+        return peak
+    import resource
+    # ru_maxrss is kB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / (1024 if sys.platform == 'darwin' else 1)
+
+def current_rss_mb():
+    rss = _status_mb('VmRSS')
+    # Peak rather than current RSS where /proc is unavailable
+    return rss if rss is not None else peak_rss_mb()
+
+def _cache_file(arr):
+    # Path of the .npy file arr is the whole of, or None
+    path = getattr(arr, 'filename', None)
+    if path is None or not arr.flags.c_contiguous:
+        return None
+    try:
+        on_disk = np.load(path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    # Slices of a memmap keep its filename and offset, so compare the shape too
+    if (on_disk.shape, on_disk.dtype, on_disk.offset) != (arr.shape, arr.dtype, arr.offset):
+        return None
+    return path
+
+def share_array(arr):
+    # (shm, spec) for pool workers; shm is None when workers reopen the file
+    path = _cache_file(arr)
+    if path is not None:
+        return None, path
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[:] = arr
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+def attach_array(spec):
+    if isinstance(spec, str):
+        return None, np.load(spec, mmap_mode='r')
+    name, shape, dtype = spec
+    # Pool workers share the parent's resource tracker, so the block is
+    # unlinked once, by the parent, when the pool is done with it
+    shm = shared_memory.SharedMemory(name=name)
+    arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    arr.flags.writeable = False
+    return shm, arr
+
+def init_worker(spec, solved, n_patterns, guess_pool, pool_started, profiling=False, memory_cap_mb=None):
+    shm, patterns = attach_array(spec)
+    _WORKER.update(shm=shm, patterns=patterns, solved=solved, n_patterns=n_patterns,
+                   guess_pool=guess_pool, startup=time.time() - pool_started, profiling=profiling,
+                   memory_cap_mb=memory_cap_mb)
+
+def build_subtrees(chunk):
+    # Pool task: a chunk of (feedback code, candidates) partitions -> their subtrees.
+    # First-level partitions are the states of turn 2.
+    profile = SolverProfile() if _WORKER["profiling"] else None
+    trees = [(code, build_strategy_tree(_WORKER["patterns"], group, _WORKER["solved"],
+                                        _WORKER["n_patterns"], _WORKER["guess_pool"], profile, 2,
+                                        _WORKER["memory_cap_mb"]))
+             for code, group in chunk]
+    stats = {"pid": os.getpid(), "startup": _WORKER["startup"], "rss_mb": current_rss_mb(),
+             "profile": profile.to_dict() if profile is not None else None}
+    return trees, stats
+
+def chunk_groups(groups, n_chunks):
+    # Largest partitions first, dealt round-robin so chunks have similar work
+    groups = sorted(groups, key=lambda item: len(item[1]), reverse=True)
+    chunks = [groups[i::n_chunks] for i in range(n_chunks)]
+    return [chunk for chunk in chunks if chunk]
+
+def build_strategy_tree_parallel(patterns, candidates, solved, n_patterns=None, guess_pool=None,
+                                 max_workers=None, chunks_per_worker=4, profile=None, memory_cap_mb=None):
+    # Expand the root here, then farm out the first-level partitions in chunks.
+    # Returns the tree and {pid: {"startup", "rss_mb", "tasks"}} per worker.
+    # A SolverProfile passed as profile collects the root and every worker.
+    candidates = np.asarray(candidates)
+    max_workers = max_workers or os.cpu_count()
+    t0 = time.perf_counter()
+    guess_idx, ent = choose_guess(patterns, candidates, guess_pool, n_patterns, memory_cap_mb)
+    t1 = time.perf_counter()
+    root = {"guess": guess_idx, "entropy": ent, "size": len(candidates),
+            "solved": [], "children": {}}
+    groups = []
+    root_groups = partition(patterns, guess_idx, candidates)
+    if profile is not None:
+        pool = len(candidates) if guess_pool is None else len(guess_pool)
+        profile.record(1, t1 - t0, time.perf_counter() - t1, pool * len(candidates), len(candidates))
+    for code, group in root_groups.items():
+        if code == solved:
+            root["solved"] = group.tolist()
+        else:
+            groups.append((code, group))
+    chunks = chunk_groups(groups, max_workers * chunks_per_worker)
+    worker_stats = {}
+    shm, spec = share_array(patterns)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, initializer=init_worker,
+                initargs=(spec, solved, n_patterns, guess_pool, time.time(), profile is not None,
+                          memory_cap_mb)) as executor:
+            for trees, stats in executor.map(build_subtrees, chunks):
+                root["children"].update(trees)
+                if profile is not None:
+                    profile.merge(stats["profile"])
+                entry = worker_stats.setdefault(stats["pid"], {"startup": stats["startup"], "rss_mb": 0.0, "tasks": 0})
+                entry["rss_mb"] = max(entry["rss_mb"], stats["rss_mb"])
+                entry["tasks"] += 1
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+    root["children"] = dict(sorted(root["children"].items()))
+    return root, worker_stats
+
+# --- 8. Headless batch output ---
+def headless_mode():
+    # Batch runs never import matplotlib: pass --headless or set WORDLE_HEADLESS=1
+    return '--headless' in sys.argv or os.environ.get('WORDLE_HEADLESS') == '1'
+
+def write_results(path, results):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump(results, f, indent=1)
+    os.replace(tmp, path)
@@ -0,0 +1,108 @@
+import sys
+import time
+import numpy as np
+from wordle_engine import encode_words, peak_rss_mb, read_word_rows
+
+# Streaming letter statistics for word lists of any size.
+# Words are read from a file in fixed-size byte blocks (read_word_rows) and
+# turned into an (n, length) array of letter codes (a=0 .. z=25); all
+# counting is done with bincount/matmul on those arrays. The per-word letter
+# counts are built CHUNK_WORDS words at a time, so memory is bounded by the
+# block size plus a few MB, not by the size of the corpus.
+
+# --- 1. Letter codes ---
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+# Bytes per file read and words per (n, 26) count matrix. Parsing works on
+# int64 index arrays ~20x the block size, so blocks stay small (~90k words)
+BLOCK_BYTES = 1 << 19
+CHUNK_WORDS = 1 << 14
+
+def encode_letters(words):
+    # Word list (strings or ASCII rows) -> (n, length) letter codes
+    return encode_words(words) - 97
+
+# --- 2. Accumulated statistics ---
+class LetterStats:
+    def __init__(self, length):
+        self.length = length
+        self.words = 0
+        self.skipped = 0
+        # position[p, c]: words with letter c at position p
+        self.position = np.zeros((length, 26), dtype=np.int64)
+        # pairs[a, b]: words containing both a and b (a != b); the diagonal
+        # counts words where that letter appears more than once
+        self.pairs = np.zeros((26, 26), dtype=np.int64)
+        # multiplicity[k]: words whose most repeated letter appears k times
+        self.multiplicity = np.zeros(length + 1, dtype=np.int64)
+
+    def update(self, codes, skipped=0):
+        n = len(codes)
+        self.words += n
+        self.skipped += skipped
+        if n == 0:
+            return
+        offsets = np.arange(self.length) * 26
+        self.position += np.bincount((codes + offsets).ravel(),
+                                     minlength=self.length * 26).reshape(self.length, 26)
+        for start in range(0, n, CHUNK_WORDS):
+            self._count_letters(codes[start:start + CHUNK_WORDS])
+
+    def _count_letters(self, codes):
+        # Pair, repeat and multiplicity counts for one chunk of words
+        n = len(codes)
+        per_word = np.bincount((codes + (np.arange(n) * 26)[:, None]).ravel(),
+                               minlength=n * 26).reshape(n, 26)
+        present = (per_word > 0).astype(np.float32)
+        # float32 BLAS is exact here: every entry is at most n
+        together = (present.T @ present).astype(np.int64)
+        np.fill_diagonal(together, (per_word > 1).sum(axis=0))
+        self.pairs += together
+        self.multiplicity += np.bincount(per_word.max(axis=1), minlength=self.length + 1)
+
+    def update_words(self, words):
+        self.update(encode_letters(words))
+
+    def letter_counts(self):
+        # Overall frequency of each letter, over every position
+        return dict(zip(ALPHABET, self.position.sum(axis=0).tolist()))
+
+    def top_pairs(self, k=10):
+        a, b = np.triu_indices(26, 1)
+        counts = self.pairs[a, b]
+        order = np.argsort(-counts, kind='stable')[:k]
+        return [(ALPHABET[a[i]] + ALPHABET[b[i]], int(counts[i])) for i in order]
+
+    def to_dict(self):
+        return {
+            "word_length": self.length, "words": self.words, "skipped_lines": self.skipped,
+            "letters": self.letter_counts(),
+            "by_position": [dict(zip(ALPHABET, row)) for row in self.position.tolist()],
+            "pairs": {ALPHABET[a] + ALPHABET[b]: int(self.pairs[a, b])
+                      for a in range(26) for b in range(a + 1, 26) if self.pairs[a, b]},
+            "repeated_letter_words": int(self.multiplicity[2:].sum()),
+            "repeats_by_letter": dict(zip(ALPHABET, np.diag(self.pairs).tolist())),
+            "max_multiplicity": {k: int(c) for k, c in enumerate(self.multiplicity.tolist()) if c},
+        }
+
+def analyze_file(path, length, block_bytes=BLOCK_BYTES):
+    stats = LetterStats(length)
+    for rows, skipped in read_word_rows(path, length, block_bytes):
+        stats.update(rows - 97, skipped)
+    return stats
+
+def print_summary(stats):
+    print(f"{stats.words:,} {stats.length}-letter words ({stats.skipped:,} lines skipped)")
+    print("Most common letter per position: " +
+          ", ".join(f"{p + 1}:{ALPHABET[c]}" for p, c in enumerate(stats.position.argmax(axis=1))))
+    print(f"Words with a repeated letter: {int(stats.multiplicity[2:].sum()):,} "
+          f"({stats.multiplicity[2:].sum() / max(stats.words, 1):.1%})")
+    print("Most common letter pairs: " + ", ".join(f"{pair} {count:,}" for pair, count in stats.top_pairs()))
+
+# python wordle_letters.py <word file> <word length>
+if __name__ == "__main__":
+    path, length = sys.argv[1], int(sys.argv[2])
+    t0 = time.perf_counter()
+    stats = analyze_file(path, length)
+    elapsed = time.perf_counter() - t0
+    print_summary(stats)
+    print(f"Analyzed in {elapsed:.2f} s ({stats.words / elapsed:,.0f} words/s), peak RSS {peak_rss_mb():.1f} MB")
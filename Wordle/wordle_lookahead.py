@@ -0,0 +1,212 @@
+import concurrent.futures
+import json
+import math
+import os
+import time
+import numpy as np
+from wordle_engine import (LRUCache, attach_array, build_strategy_tree, choose_guess, expected_entropies,
+                           partition, pattern_to_string, share_array, state_key, strategy_paths, summarize_paths)
+
+# Lookahead solver that minimizes the expected number of guesses.
+# The cost of a state is the total number of guesses needed to solve every
+# candidate in it (expected turns = cost / size). Playing guess g costs one
+# guess per candidate plus the cost of every partition g leaves unsolved.
+# The top_k highest-entropy guesses are searched exactly for `depth` plies;
+# below that the greedy-entropy policy is followed and its exact cost used.
+
+def lower_bound(n):
+    # Admissible: at most one candidate is solved by the next guess, every
+    # other one needs at least two
+    return 1 if n == 1 else 2*n - 1
+
+class LookaheadSolver:
+    def __init__(self, patterns, solved, n_patterns=None, guess_pool=None,
+                 top_k=10, depth=2, cache_size=1000000, memory_cap_mb=None):
+        self.patterns = patterns
+        self.memory_cap_mb = memory_cap_mb
+        self.solved = solved
+        self.n_patterns = n_patterns
+        self.guess_pool = guess_pool
+        self.top_k = top_k
+        self.depth = depth
+        self.n_targets = patterns.shape[1]
+        # (state fingerprint, depth) -> (cost, guess) for exact results, or a
+        # lower bound for states whose search was cut off by the budget
+        self.exact = LRUCache(cache_size)
+        self.bounds = LRUCache(cache_size)
+        self.greedy = LRUCache(cache_size)
+        self.expanded = 0
+        self.pruned = 0
+
+    # --- Greedy policy below the lookahead horizon ---
+    def greedy_cost(self, candidates):
+        n = len(candidates)
+        if n == 1:
+            return 1, int(candidates[0])
+        key = state_key(candidates, self.n_targets)
+        result = self.greedy.get(key)
+        if result is None:
+            guess, _ = choose_guess(self.patterns, candidates, self.guess_pool, self.n_patterns, self.memory_cap_mb)
+            cost = n
+            for code, group in partition(self.patterns, guess, candidates).items():
+                if code != self.solved:
+                    cost += self.greedy_cost(group)[0]
+            result = (cost, guess)
+            self.greedy.put(key, result)
+        return result
+
+    # --- Branch-and-bound search ---
+    def options(self, candidates):
+        # The top_k guesses by expected entropy that actually split the state
+        pool = candidates if self.guess_pool is None else self.guess_pool
+        entropies = expected_entropies(self.patterns, candidates, pool, self.n_patterns, self.memory_cap_mb)
+        order = np.argsort(-entropies, kind='stable')[:self.top_k]
+        return [int(pool[i]) for i in order if entropies[i] > 0 or pool[i] in candidates]
+
+    def guess_cost(self, candidates, guess, depth, budget=math.inf):
+        # Exact cost of playing guess here if it is below budget, otherwise
+        # some value >= budget
+        groups = [group for code, group in partition(self.patterns, guess, candidates).items()
+                  if code != self.solved]
+        bounds = [lower_bound(len(group)) for group in groups]
+        total = len(candidates) + sum(bounds)
+        if total >= budget:
+            self.pruned += 1
+            return total
+        order = sorted(range(len(groups)), key=lambda i: -len(groups[i]))
+        for i in order:
+            cost = self.solve(groups[i], depth - 1, budget - (total - bounds[i]))
+            total += cost - bounds[i]
+            if total >= budget:
+                self.pruned += 1
+                return total
+        return total
+
+    def solve(self, candidates, depth=None, budget=math.inf):
+        # Minimum total guesses for this state within the lookahead horizon
+        depth = self.depth if depth is None else depth
+        n = len(candidates)
+        if n == 2 and self.patterns[candidates[0], candidates[1]] == self.solved:
+            # Duplicate words: one guess solves both
+            return 2
+        if n <= 2:
+            return lower_bound(n)
+        if depth <= 0:
+            return self.greedy_cost(candidates)[0]
+        key = (state_key(candidates, self.n_targets), depth)
+        result = self.exact.get(key)
+        if result is not None:
+            return result[0]
+        bound = self.bounds.get(key, lower_bound(n))
+        if bound >= budget:
+            return bound
+        self.expanded += 1
+        best, best_guess, best_bound = math.inf, None, math.inf
+        for guess in self.options(candidates):
+            limit = min(budget, best)
+            cost = self.guess_cost(candidates, guess, depth, limit)
+            if cost < limit:
+                best, best_guess = cost, guess
+                if best == lower_bound(n):
+                    break
+            else:
+                best_bound = min(best_bound, cost)
+        if best < budget:
+            self.exact.put(key, (best, best_guess))
+            return best
+        self.bounds.put(key, max(bound, best_bound))
+        return best_bound
+
+    def choice(self, candidates, depth):
+        if len(candidates) <= 2:
+            return int(candidates[0])
+        if depth <= 0:
+            return self.greedy_cost(candidates)[1]
+        key = (state_key(candidates, self.n_targets), depth)
+        result = self.exact.get(key)
+        if result is None:
+            self.solve(candidates, depth)
+            result = self.exact.get(key)
+        return result[1]
+
+    # --- Strategy tree in the same node format as build_strategy_tree ---
+    def build_tree(self, candidates, depth=None, guess=None):
+        depth = self.depth if depth is None else depth
+        candidates = np.asarray(candidates)
+        if guess is None:
+            guess = self.choice(candidates, depth)
+        ent = float(expected_entropies(self.patterns, candidates, np.array([guess]), self.n_patterns,
+                                       self.memory_cap_mb)[0])
+        node = {"guess": guess, "entropy": ent, "size": len(candidates), "solved": [], "children": {}}
+        for code, group in partition(self.patterns, guess, candidates).items():
+            if code == self.solved:
+                node["solved"] = group.tolist()
+            else:
+                node["children"][code] = self.build_tree(group, max(depth - 1, 0))
+        return node
+
+    def stats(self):
+        return {"expanded": self.expanded, "pruned": self.pruned,
+                "exact": self.exact.stats(), "greedy": self.greedy.stats()}
+
+# --- Parallel evaluation of the top-level guesses ---
+_WORKER = {}
+
+def _init_worker(spec, solver_kwargs):
+    shm, patterns = attach_array(spec)
+    _WORKER.update(shm=shm, solver=LookaheadSolver(patterns, **solver_kwargs))
+
+def _evaluate_opening(args):
+    candidates, guess = args
+    solver = _WORKER["solver"]
+    cost = solver.guess_cost(candidates, guess, solver.depth)
+    return guess, cost, solver.build_tree(candidates, guess=guess)
+
+def solve_lookahead(patterns, candidates, solved, n_patterns=None, guess_pool=None,
+                    top_k=10, depth=2, max_workers=None, memory_cap_mb=None):
+    # Evaluate each of the top_k openings exactly in its own worker process
+    # (the pattern table is shared read-only), then keep the cheapest.
+    # Returns (tree, total cost of the tree).
+    candidates = np.asarray(candidates)
+    solver_kwargs = dict(solved=solved, n_patterns=n_patterns, guess_pool=guess_pool, top_k=top_k, depth=depth,
+                         memory_cap_mb=memory_cap_mb)
+    openings = LookaheadSolver(patterns, **solver_kwargs).options(candidates)
+    shm, spec = share_array(patterns)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers or os.cpu_count(), initializer=_init_worker,
+                initargs=(spec, solver_kwargs)) as executor:
+            results = list(executor.map(_evaluate_opening, [(candidates, g) for g in openings]))
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+    # Ties go to the higher-entropy opening, matching options() order
+    _, cost, tree = min(results, key=lambda r: r[1])
+    return tree, cost
+
+# --- Saving and benchmarking ---
+def strategy_to_json(tree, guesses, n):
+    # Nested {"guess": word, "size": k, "children": {"01200": subtree}}
+    return {"guess": guesses[tree["guess"]], "size": tree["size"],
+            "children": {pattern_to_string(code, n): strategy_to_json(child, guesses, n)
+                         for code, child in tree["children"].items()}}
+
+def save_strategy(tree, path, guesses, n, avg_turns):
+    with open(path, 'w') as f:
+        json.dump({"word_length": n, "average_turns": avg_turns,
+                   "tree": strategy_to_json(tree, guesses, n)}, f)
+
+def benchmark_against_greedy(patterns, candidates, solved, n_patterns=None, guess_pool=None,
+                             top_k=10, depth=2, max_workers=None, memory_cap_mb=None):
+    # Runtime and average turns of the greedy tree vs. the lookahead tree
+    results = {}
+    t0 = time.perf_counter()
+    greedy_tree = build_strategy_tree(patterns, candidates, solved, n_patterns, guess_pool,
+                                      memory_cap_mb=memory_cap_mb)
+    results["greedy"] = (summarize_paths(strategy_paths(greedy_tree))[1], time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    tree, _ = solve_lookahead(patterns, candidates, solved, n_patterns, guess_pool, top_k, depth, max_workers,
+                              memory_cap_mb)
+    results["lookahead"] = (summarize_paths(strategy_paths(tree))[1], time.perf_counter() - t0)
+    return tree, results
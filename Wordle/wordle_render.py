@@ -0,0 +1,165 @@
+import math
+import shutil
+import subprocess
+import time
+from collections import Counter
+import numpy as np
+
+# Entropy-trace animation that stays fast with thousands of games.
+# Identical traces are drawn once, with a line width that grows with the
+# number of games sharing them. Frames are rendered on an off-screen Agg
+# canvas: each frame restores the cached background (every trace drawn so
+# far), draws only the traces it adds, and caches the result again, so the
+# per-frame cost does not grow with the traces already on screen. Frames are
+# written straight to a file: an ffmpeg pipe for .mp4 when ffmpeg is
+# installed, otherwise an animated GIF. matplotlib is only imported here.
+
+def dedupe_traces(entropy_logs, decimals=9):
+    # [(trace, number of games)] in first-seen order
+    return list(Counter(tuple(round(e, decimals) for e in trace) for trace in entropy_logs).items())
+
+def trace_segments(traces):
+    return [np.column_stack([np.arange(1, len(trace) + 1), trace]) for trace, _ in traces]
+
+def trace_widths(traces, base=0.5):
+    return [base * (1 + math.log2(count)) for _, count in traces]
+
+def trace_collection(traces, **kwargs):
+    # One LineCollection for a whole set of deduplicated traces
+    from matplotlib.collections import LineCollection
+    return LineCollection(trace_segments(traces), linewidths=trace_widths(traces),
+                          colors='gray', alpha=0.2, **kwargs)
+
+# --- Frame sinks ---
+class FFMpegSink:
+    def __init__(self, path, width, height, fps):
+        self.proc = subprocess.Popen(
+            [shutil.which("ffmpeg"), "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgba",
+             "-s", f"{width}x{height}", "-r", str(fps), "-i", "-", "-pix_fmt", "yuv420p", path],
+            stdin=subprocess.PIPE)
+
+    def write(self, rgba):
+        self.proc.stdin.write(rgba.tobytes())
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+class GifSink:
+    # Streams each frame to the file as it arrives, so memory stays at one
+    # frame whatever the animation length. Every frame carries its own
+    # 64-colour palette
+    def __init__(self, path, fps):
+        self.path = path
+        self.duration = round(1000 / fps)
+        self.file = None
+
+    def write(self, rgba):
+        from PIL import GifImagePlugin, Image
+        frame = Image.fromarray(rgba[..., :3]).quantize(colors=64)
+        if self.file is None:
+            self.file = open(self.path, "wb")
+            header, _ = GifImagePlugin.getheader(frame, info={"loop": 0})
+            self.file.write(b"".join(header))
+        data = GifImagePlugin.getdata(frame, duration=self.duration, include_color_table=True)
+        self.file.write(b"".join(data))
+
+    def close(self):
+        if self.file is not None:
+            self.file.write(b";")
+            self.file.close()
+            self.file = None
+
+def frame_sink(path, width, height, fps):
+    if path.lower().endswith(".mp4"):
+        if shutil.which("ffmpeg") is None:
+            raise RuntimeError("writing .mp4 needs ffmpeg on PATH; use a .gif path instead")
+        return FFMpegSink(path, width, height, fps)
+    return GifSink(path, fps)
+
+# --- Animation ---
+def render_trace_animation(entropy_logs, avg_entropy_by_turn, path, title,
+                           max_frames=200, fps=30, dpi=100):
+    # Writes the animation to path and returns render statistics, including
+    # the per-frame render times
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    traces = dedupe_traces(entropy_logs)
+    per_frame = max(1, -(-len(traces) // max_frames))
+
+    fig = Figure(figsize=(8,5), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_xlim(0.5, max(len(avg_entropy_by_turn), max(len(t) for t, _ in traces)) + 0.5)
+    ax.set_ylim(0, max(max(avg_entropy_by_turn), max(t[0] for t, _ in traces)) + 0.5)
+    ax.set_title(title)
+    ax.set_xlabel("Turn")
+    ax.set_ylabel("Expected Entropy (bits)")
+    ax.grid(True)
+    # The batch collection holds only the traces added by the current frame;
+    # everything drawn before lives in the cached background
+    batch = trace_collection([], animated=True)
+    ax.add_collection(batch)
+    avg_line, = ax.plot(range(1, len(avg_entropy_by_turn)+1), avg_entropy_by_turn,
+                        lw=3, color='blue', label='Average Entropy', animated=True)
+    ax.legend(loc='upper right')
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+
+    width, height = canvas.get_width_height()
+    sink = frame_sink(path, width, height, fps)
+    frame_times = []
+    try:
+        for start in range(0, len(traces), per_frame):
+            t0 = time.perf_counter()
+            chunk = traces[start:start + per_frame]
+            canvas.restore_region(background)
+            batch.set_segments(trace_segments(chunk))
+            batch.set_linewidths(trace_widths(chunk))
+            ax.draw_artist(batch)
+            background = canvas.copy_from_bbox(fig.bbox)
+            ax.draw_artist(avg_line)
+            frame = np.asarray(canvas.buffer_rgba())
+            frame_times.append(time.perf_counter() - t0)
+            sink.write(frame)
+    finally:
+        sink.close()
+    return {"games": len(entropy_logs), "unique_traces": len(traces), "frames": len(frame_times),
+            "traces_per_frame": per_frame, "frame_times": frame_times, "path": path}
+
+def print_render_stats(stats):
+    times = stats["frame_times"]
+    quarter = max(1, len(times) // 4)
+    print(f"Wrote {stats['path']}: {stats['frames']} frames, {stats['unique_traces']} unique traces "
+          f"for {stats['games']} games ({stats['traces_per_frame']} per frame)")
+    print(f"  render ms/frame: first quarter {np.mean(times[:quarter]) * 1000:.2f}, "
+          f"last quarter {np.mean(times[-quarter:]) * 1000:.2f}")
+
+# --- Solver plots ---
+def plot_results(entropy_logs, avg_entropy_by_turn, length, animation_file, plot="average"):
+    # Animates every game's entropy trace to animation_file, then shows either
+    # the average entropy drop ("average") or every trace at once ("traces")
+    import matplotlib.pyplot as plt
+
+    print_render_stats(render_trace_animation(
+        entropy_logs, avg_entropy_by_turn, animation_file,
+        f"Entropy Drop While Solving {length}-Letter Wordle"))
+
+    turns = range(1, len(avg_entropy_by_turn)+1)
+    fig, ax = plt.subplots(figsize=(8,5))
+    if plot == "traces":
+        # Identical traces are drawn once, wider the more games share them
+        ax.add_collection(trace_collection(dedupe_traces(entropy_logs)))
+        ax.autoscale_view()
+        ax.plot(turns, avg_entropy_by_turn, color='blue', label='Average')
+        ax.set_title(f"Entropy Traces for All Games ({length}-Letter Wordle)")
+        ax.legend()
+    else:
+        ax.plot(turns, avg_entropy_by_turn, color='blue', marker='o')
+        ax.set_title(f"Entropy Drop While Solving {length}-Letter Wordle (Average)")
+    ax.set_xlabel("Turn")
+    ax.set_ylabel("Expected Entropy (bits)")
+    ax.grid(True)
+    fig.tight_layout()
+    plt.show()
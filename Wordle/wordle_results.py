@@ -0,0 +1,119 @@
+import struct
+import zipfile
+import numpy as np
+
+# Columnar storage for simulated games. Every game's guess path and entropy
+# trace are stored back to back in flat arrays (the ragged-tensor layout):
+# game i owns values offsets[i]:offsets[i+1]. Saved as an uncompressed .npz,
+# so load_results can memory-map each array straight out of the archive and
+# per-turn statistics of very large runs never need the games re-simulated
+# or turned back into Python lists.
+
+class GameResults:
+    def __init__(self, secrets, offsets, guesses, entropies, words=None):
+        self.secrets = secrets          # (games,) target index of each game
+        self.offsets = offsets          # (games + 1,) start of each game in the flat arrays
+        self.guesses = guesses          # (total turns,) guess row played each turn
+        self.entropies = entropies      # (total turns,) expected entropy of that guess
+        self.words = words              # optional (n_guesses, N) uint8 word rows
+
+    @classmethod
+    def from_paths(cls, paths, words=None):
+        # From strategy_paths output, ordered by target index
+        secrets = np.array(sorted(paths), dtype=np.int32)
+        turns = np.array([len(paths[s][0]) for s in secrets.tolist()], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(turns)))
+        guesses = np.fromiter((g for s in secrets.tolist() for g in paths[s][0]), dtype=np.int32, count=offsets[-1])
+        entropies = np.fromiter((e for s in secrets.tolist() for e in paths[s][1]), dtype=np.float64,
+                                count=offsets[-1])
+        return cls(secrets, offsets, guesses, entropies, words)
+
+    def __len__(self):
+        return len(self.secrets)
+
+    @property
+    def turns(self):
+        return np.diff(self.offsets)
+
+    def game(self, i):
+        # (secret, guess path, entropy trace) of the i-th game
+        start, stop = self.offsets[i], self.offsets[i+1]
+        return int(self.secrets[i]), self.guesses[start:stop], self.entropies[start:stop]
+
+    def traces(self):
+        # Entropy traces as lists, for plotting
+        return [trace.tolist() for trace in np.split(np.asarray(self.entropies), self.offsets[1:-1])]
+
+    # --- Vectorized per-turn statistics ---
+    def turn_index(self):
+        # 0-based turn number of every flat value
+        turns = self.turns
+        return np.arange(self.offsets[-1]) - np.repeat(self.offsets[:-1], turns)
+
+    def turn_histogram(self):
+        # {turns: games}
+        counts = np.bincount(self.turns)
+        return {int(t): int(c) for t, c in enumerate(counts) if c}
+
+    def mean_by_turn(self):
+        turn = self.turn_index()
+        return np.bincount(turn, weights=self.entropies) / np.bincount(turn)
+
+    def quantiles_by_turn(self, qs=(0.1, 0.5, 0.9)):
+        # (max turns, len(qs)) entropy quantiles per turn, interpolated linearly
+        # like np.quantile; one sort for every turn at once
+        turn = self.turn_index()
+        values = np.asarray(self.entropies)[np.lexsort((self.entropies, turn))]
+        counts = np.bincount(turn)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        pos = (counts - 1)[:, None] * np.asarray(qs)[None, :]
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.minimum(lo + 1, (counts - 1)[:, None])
+        frac = pos - lo
+        return values[starts[:, None] + lo] * (1 - frac) + values[starts[:, None] + hi] * frac
+
+    def entropy_histograms(self, bins=20):
+        # ((max turns, bins) counts, bin edges) of entropy per turn
+        turn = self.turn_index()
+        top = float(np.max(self.entropies)) if len(self.entropies) else 1.0
+        edges = np.linspace(0, top or 1.0, bins + 1)
+        idx = np.minimum((np.asarray(self.entropies) / edges[1]).astype(np.int64), bins - 1)
+        n_turns = int(turn.max()) + 1 if len(turn) else 0
+        counts = np.bincount(turn * bins + idx, minlength=n_turns * bins).reshape(n_turns, bins)
+        return counts, edges
+
+    def summary(self):
+        # Same (turn_hist, avg_turns, avg_entropy_by_turn) as summarize_paths
+        return self.turn_histogram(), float(self.turns.mean()), self.mean_by_turn().tolist()
+
+    # --- Storage ---
+    def save(self, path):
+        # Uncompressed so every member can be memory-mapped by load_results
+        arrays = dict(secrets=self.secrets, offsets=self.offsets, guesses=self.guesses, entropies=self.entropies)
+        if self.words is not None:
+            arrays["words"] = self.words
+        np.savez(path, **arrays)
+
+def _member_array(f, path, info):
+    # Memory-map one stored .npy member of a zip archive
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"{path}: {info.filename} is compressed and cannot be memory-mapped")
+    f.seek(info.header_offset)
+    name_len, extra_len = struct.unpack('<HH', f.read(30)[26:30])
+    f.seek(info.header_offset + 30 + name_len + extra_len)
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+    else:
+        shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=f.tell(), shape=shape, order='F' if fortran else 'C')
+
+def load_results(path, mmap=True):
+    if not mmap:
+        with np.load(path) as data:
+            return GameResults(**{name: data[name] for name in data.files})
+    with zipfile.ZipFile(path) as zf, open(path, 'rb') as f:
+        arrays = {info.filename[:-len(".npy")]: _member_array(f, path, info) for info in zf.infolist()}
+    return GameResults(**arrays)
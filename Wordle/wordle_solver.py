@@ -0,0 +1,189 @@
+import os
+import time
+import numpy as np
+from wordle_engine import (HardMode, LRUCache, PatternMaskIndex, SolverProfile, build_strategy_tree_parallel,
+                           cached_feedback_matrix, choose_guess, decode_words, encode_words, full_mask,
+                           load_word_list, mask_indices, solved_pattern, state_key, strategy_paths,
+                           top_opening_pairs, top_openers, tree_size, word_list_summary, write_results)
+from wordle_lookahead import benchmark_against_greedy, save_strategy
+from wordle_render import plot_results
+from wordle_results import GameResults
+
+# Full solver runs for the Entropy + Multithreading + Animation scripts. Each
+# script is a config block that calls run_solver(length, word_file, config),
+# with its settings in config under lower-case keys.
+
+class GameSimulator:
+    # Plays the greedy-entropy solver against one secret at a time, tracking
+    # the candidates as a bitset. Best guesses per state are kept in a
+    # bounded LRU keyed by the packed bitset, so memory stays flat.
+    def __init__(self, patterns, guess_pool=None, cache_size=100000, memory_cap_mb=None):
+        self.patterns = patterns
+        self.memory_cap_mb = memory_cap_mb
+        self.n_targets = patterns.shape[1]
+        self.guess_pool = guess_pool
+        # (guess, feedback) -> bitmask of consistent targets, so filtering is one AND
+        self.masks = PatternMaskIndex(patterns)
+        self.cache = LRUCache(maxsize=cache_size)
+
+    def cached_best_guess(self, candidates, key=None, guess_pool=None):
+        # A guess_pool other than self.guess_pool (e.g. the hard-mode legal
+        # guesses) must be reflected in the key
+        if key is None:
+            key = state_key(candidates, self.n_targets)
+        result = self.cache.get(key)
+        if result is None:
+            result = choose_guess(self.patterns, candidates, self.guess_pool if guess_pool is None else guess_pool,
+                                  memory_cap_mb=self.memory_cap_mb)
+            self.cache.put(key, result)
+        return result
+
+    def simulate_game(self, secret_idx, solved, profile=None, hard=None):
+        # (guess rows, entropy trace) for one game. hard: a HardMode tracker,
+        # which restricts the guess pool to legal words
+        if hard is not None:
+            hard.reset()
+        mask = full_mask(self.n_targets)
+        guesses, entropy_trace = [], []
+        while True:
+            # One batched pass scores every guess in the pool
+            candidates = mask_indices(mask, self.n_targets)
+            if profile is not None:
+                misses = self.cache.misses
+                t0 = time.perf_counter()
+            key, pool = mask.tobytes(), self.guess_pool
+            if hard is not None and pool is not None:
+                pool = hard.legal_rows(pool)
+                key += np.packbits(hard.legal).tobytes()
+            guess_idx, ent = self.cached_best_guess(candidates, key, pool)
+            if profile is not None:
+                t1 = time.perf_counter()
+            fb = int(self.patterns[guess_idx, secret_idx])
+            guesses.append(guess_idx)
+            entropy_trace.append(ent)
+            if fb != solved:
+                mask = self.masks.filter(mask, guess_idx, fb)
+                if hard is not None:
+                    hard.update(guess_idx, fb)
+            if profile is not None:
+                # Patterns are only scored when the best-guess cache misses
+                scored = len(candidates if pool is None else pool) * len(candidates)
+                scored = scored if self.cache.misses > misses else 0
+                profile.record(len(guesses), t1 - t0, time.perf_counter() - t1, scored, len(candidates))
+            if fb == solved:
+                return guesses, entropy_trace
+
+def run_solver(length, word_file, config):
+    # Solves every word of word_file, prints the turn and entropy summary and
+    # the best openers, saves the per-game results, then writes
+    # config["results_file"] (headless) or plots
+    # Answers come first so target i is also guess row i
+    target_codes, info = load_word_list(word_file, length)
+    print(word_list_summary(info))
+    targets = decode_words(target_codes)
+    guesses = targets + sorted(set(config["extra_guesses"]) - set(targets))
+    guess_codes = target_codes
+    if len(guesses) > len(targets):
+        guess_codes = np.concatenate([target_codes, encode_words(guesses[len(targets):])])
+    memory_cap_mb = config["memory_cap_mb"]
+    patterns = cached_feedback_matrix(guess_codes, target_codes, memory_cap_mb=memory_cap_mb)
+    all_targets = np.arange(len(targets))
+    solved = solved_pattern(length)
+    guess_rows = np.arange(len(guesses)) if config["guess_pool"] == "all" else None
+
+    tree = None
+    hard_mode = config["hard_mode"] and guess_rows is not None
+    if config["hard_mode"] and not hard_mode:
+        print('Warning: HARD_MODE has no effect with GUESS_POOL = "candidates"; solving without it')
+    if hard_mode:
+        # Legal guesses depend on the whole history, not only on the candidate
+        # set, so games are played one by one instead of sharing a strategy tree
+        hard = HardMode(guess_codes)
+        games = GameSimulator(patterns, guess_rows, memory_cap_mb=memory_cap_mb)
+        paths = {i: games.simulate_game(i, solved, hard=hard) for i in all_targets.tolist()}
+        print(f"Hard mode: {len(targets)} games, best-guess cache {games.cache.stats()}")
+    elif config["solver"] == "lookahead":
+        # Top-level guesses are evaluated in parallel; the greedy tree is built
+        # alongside it for a runtime/quality comparison
+        tree, results = benchmark_against_greedy(patterns, all_targets, solved, guess_pool=guess_rows,
+                                                 top_k=config["lookahead_top_k"], depth=config["lookahead_depth"],
+                                                 max_workers=os.cpu_count(), memory_cap_mb=memory_cap_mb)
+        for name, (turns, seconds) in results.items():
+            print(f"{name:>9}: {turns:.4f} average turns in {seconds:.2f} s")
+        save_strategy(tree, config["strategy_file"], guesses, length, results["lookahead"][0])
+        print(f"Saved strategy to {config['strategy_file']}")
+    else:
+        # Build the greedy-entropy strategy tree once; every secret's game is a
+        # root-to-node path, so shared openings and subtrees are computed once
+        # Use fewer workers if memory is an issue, but default to all CPUs
+        profile = SolverProfile() if config["profile"] else None
+        tree, worker_stats = build_strategy_tree_parallel(patterns, all_targets, solved, guess_pool=guess_rows,
+                                                          max_workers=os.cpu_count(), profile=profile,
+                                                          memory_cap_mb=memory_cap_mb)
+        print(f"Pattern table: {patterns.nbytes / 1e6:.1f} MB, shared by {len(worker_stats)} workers")
+        for pid, stats in sorted(worker_stats.items()):
+            print(f"  worker {pid}: startup {stats['startup']:.3f} s, RSS {stats['rss_mb']:.1f} MB, {stats['tasks']} chunks")
+        if profile is not None:
+            print("Strategy tree profile (all workers):")
+            print(profile.report())
+            # The per-game loop, with its best-guess and feedback-mask caches
+            profile = SolverProfile()
+            games = GameSimulator(patterns, guess_rows, memory_cap_mb=memory_cap_mb)
+            for i in all_targets.tolist():
+                games.simulate_game(i, solved, profile)
+            profile.record_cache("best guess", games.cache.stats())
+            profile.record_cache("feedback masks", games.masks.rows.stats())
+            print("simulate_game profile:")
+            print(profile.report())
+    # Per-game guess paths and entropy traces in columnar form, saved so
+    # large runs can be analysed later with load_results instead of re-simulating
+    if tree is not None:
+        paths = strategy_paths(tree)
+    results = GameResults.from_paths(paths, guess_codes)
+    results.save(config["games_file"])
+
+    # Turn histogram and entropy per turn
+    turn_hist, avg_turns, avg_entropy_by_turn = results.summary()
+    if tree is not None:
+        print(f"Strategy tree: {tree_size(tree)} nodes")
+    print(f"Average turns: {avg_turns:.4f}")
+    for turns, count in turn_hist.items():
+        print(f"  solved in {turns}: {count}")
+    print(f"Entropy by turn (mean, p10 / p50 / p90), saved to {config['games_file']}:")
+    for turn, (mean, (p10, p50, p90)) in enumerate(zip(avg_entropy_by_turn, results.quantiles_by_turn()), 1):
+        print(f"  turn {turn}: {mean:.3f}, {p10:.3f} / {p50:.3f} / {p90:.3f}")
+
+    # Rank the best starting words and two-word openings by expected entropy
+    t0 = time.perf_counter()
+    top_words = top_openers(patterns, all_targets, config["top_openers"], memory_cap_mb=memory_cap_mb)
+    elapsed = time.perf_counter() - t0
+    print(f"Scored {len(guesses)} guesses against {len(targets)} targets in {elapsed:.3f} s "
+          f"({len(guesses) / elapsed:,.0f} guesses/s)")
+    print(f"Top {config['top_openers']} starting words by expected entropy (higher is better):")
+    for rank, (ent, g) in enumerate(top_words, 1):
+        print(f"{rank:2d}. {guesses[g]}  ({ent:.4f} bits)")
+
+    top_pairs = []
+    if config["top_opening_pairs"]:
+        t0 = time.perf_counter()
+        top_pairs, scored = top_opening_pairs(patterns, all_targets, config["top_opening_pairs"],
+                                              memory_cap_mb=memory_cap_mb)
+        elapsed = time.perf_counter() - t0
+        total = len(guesses) * (len(guesses) - 1) // 2
+        print(f"Scored {scored:,} of {total:,} opening pairs ({scored / total:.1%}) in {elapsed:.2f} s")
+        print(f"Top {config['top_opening_pairs']} two-word openings by joint entropy:")
+        for rank, (ent, g1, g2) in enumerate(top_pairs, 1):
+            print(f"{rank:2d}. {guesses[g1]} + {guesses[g2]}  ({ent:.4f} bits)")
+
+    if config["headless"]:
+        write_results(config["results_file"], {
+            "word_length": length, "solver": config["solver"], "average_turns": avg_turns,
+            "turn_histogram": turn_hist, "avg_entropy_by_turn": avg_entropy_by_turn,
+            "top_starting_words": [[guesses[g], ent] for ent, g in top_words],
+            "top_opening_pairs": [[guesses[g1], guesses[g2], ent] for ent, g1, g2 in top_pairs],
+            "games": [{"secret": targets[secret], "guesses": [guesses[g] for g in played.tolist()],
+                       "entropy_trace": trace.tolist()} for secret, played, trace in map(results.game, range(len(results)))],
+        })
+        print(f"Wrote {config['results_file']}")
+    else:
+        plot_results(results.traces(), avg_entropy_by_turn, length, config["animation_file"], config["plot"])